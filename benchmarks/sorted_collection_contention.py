@@ -0,0 +1,86 @@
+"""Readers/writers contention on a shared sorted collection.
+
+Compares a SortedCollection behind one global lock with the lock-free reads of
+ConcurrentSortedCollection. Run from the repository root:
+
+    python -m benchmarks.sorted_collection_contention --readers 8 --writers 2
+"""
+import argparse
+import threading
+import time
+from random import Random
+
+from src.sorted_collection import ConcurrentSortedCollection, SortedCollection
+
+
+class LockedSortedCollection:
+    "The baseline: every call takes the same lock"
+
+    def __init__(self, items, key):
+        self._lock = threading.Lock()
+        self._collection = SortedCollection(items, key)
+
+    def find(self, relation_op, k):
+        with self._lock:
+            return self._collection.find(relation_op, k)
+
+    def insert(self, item):
+        with self._lock:
+            self._collection.insert(item)
+
+    def remove(self, k):
+        with self._lock:
+            self._collection.remove(k)
+
+
+def run(collection, readers, writers, operations, size):
+    reads = [0] * readers
+
+    def read(n):
+        random = Random(n)
+        for _ in range(operations):
+            try:
+                collection.find(">=", random.randrange(size))
+            except ValueError:
+                pass
+            reads[n] += 1
+
+    def write(n):
+        random = Random(-n - 1)
+        for _ in range(operations // 10):
+            k = random.randrange(size)
+            collection.insert(k)
+            collection.remove(k)
+
+    threads = [threading.Thread(target=read, args=(n,)) for n in range(readers)]
+    threads += [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(reads) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--operations", type=int, default=20000)
+    args = parser.parse_args()
+    items = range(0, 2 * args.size, 2)
+    candidates = [
+        ("global lock", LockedSortedCollection(items, int)),
+        ("copy-on-write", ConcurrentSortedCollection(items, int)),
+    ]
+    for name, collection in candidates:
+        throughput = run(
+            collection, args.readers, args.writers, args.operations, 2 * args.size
+        )
+        print("%-14s %12.0f reads/s" % (name, throughput))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,40 @@
-from typing import Callable, Optional
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Condition = Callable[[int], bool]
+
+
+def _memoized(condition: Condition, memo: Optional[Dict[int, bool]]) -> Condition:
+    if memo is None:
+        return condition
+
+    def cached(index: int) -> bool:
+        if index not in memo:
+            memo[index] = condition(index)
+        return memo[index]
+
+    return cached
+
+
+def _bisect(condition: Condition, left: int, right: int) -> int:
+    """condition(left)がFalse, condition(right)がTrueであるときの境界を探す
+
+    1ステップにつきconditionを1回だけ呼び、最初にTrueとなるindexを返す.
+    """
+    while right - left > 1:
+        mid = (left + right) // 2
+        if condition(mid):
+            right = mid
+        else:
+            left = mid
+    return right
 
 
 def binary_search(
-    condition: Callable[[int], bool], initial_left: int, initial_right: int
+    condition: Condition,
+    initial_left: int,
+    initial_right: int,
+    memo: Optional[Dict[int, bool]] = None,
 ) -> Optional[int]:
     """条件を満たす最初のindexを二分探索で探す
 
@@ -10,28 +42,218 @@ def binary_search(
     F -> TとなるときのTのインデックスを二分探索する.
     返り値よりも小さい値ではconditionはFalseであり、 大きい値ではconditionはTrueとなる.
     ただし、そのような解が存在しない場合はNoneを返す.
+    conditionの呼び出しは1ステップにつき1回で、全体でおよそlog2(right - left) + 2回.
 
     Args:
         condition (Callable[[int], bool]):
         initial_left (int):
         initial_right (int):
+        memo (Optional[Dict[int, bool]]): 与えるとconditionの結果をここに記録し、
+            同じindexを再評価しない. 呼び出しをまたいで使い回せる.
+
+    Returns:
+        Optional[int]:　解が見つからない場合はNoneを返し、conditionが常に真であるときはinitial_leftを返す.
+    """
+    condition = _memoized(condition, memo)
+    if condition(initial_left):  # all True
+        return initial_left
+    elif initial_left >= initial_right or not condition(initial_right):  # all False
+        return None
+    else:
+        return _bisect(condition, initial_left, initial_right)
+
+
+def gallop_search(
+    condition: Condition,
+    start: int = 0,
+    limit: Optional[int] = None,
+    memo: Optional[Dict[int, bool]] = None,
+) -> Optional[int]:
+    """上限を指定せずに、start以降で条件を満たす最初のindexを探す
+
+    start, start + 1, start + 2, start + 4, start + 8, ... と間隔を倍にしながら
+    Trueとなるindexを探し、見つかった区間を二分探索する.
+    答えをaとしておよそ2 * log2(a - start)回conditionを呼ぶ.
+
+    Args:
+        condition (Callable[[int], bool]):
+        start (int):
+        limit (Optional[int]): これを超えて探さない. 省略時は見つかるまで探す.
+        memo (Optional[Dict[int, bool]]): binary_searchと同じ.
 
     Returns:
-        Optional[int]:　解が見つからない場合はNoneを返し、conditionが常に真であるときはinitial_rightを返す.
+        Optional[int]: limitまでに解が見つからない場合はNoneを返す.
     """
+    condition = _memoized(condition, memo)
+    if condition(start):
+        return start
+    left, step = start, 1
+    while True:
+        right = start + step
+        if limit is not None and right >= limit:
+            if left >= limit or not condition(limit):
+                return None
+            return _bisect(condition, left, limit)
+        if condition(right):
+            return _bisect(condition, left, right)
+        left, step = right, step * 2
 
-    def search(left: int, right: int) -> int:
-        mid = (left + right) // 2
+
+def real_binary_search(
+    condition: Callable[[float], bool],
+    initial_left: float,
+    initial_right: float,
+    tolerance: float = 1e-9,
+    max_iterations: int = 200,
+) -> Optional[float]:
+    """実数の範囲で条件を満たす最小の値を二分探索で近似する
+
+    conditionは単調 (ある値より小さいとFalse, 以上だとTrue) であるとする.
+    区間の幅がtoleranceを下回るか、max_iterations回に達するまで区間を半分にする.
+
+    Returns:
+        Optional[float]: conditionを満たし、境界との差がtolerance以下の値.
+            initial_rightで満たさない場合はNone、initial_leftで満たす場合はinitial_leftを返す.
+    """
+    if condition(initial_left):
+        return initial_left
+    if not condition(initial_right):
+        return None
+    left, right = initial_left, initial_right
+    for _ in range(max_iterations):
+        if right - left <= tolerance:
+            break
+        mid = left + (right - left) / 2
+        if mid <= left or mid >= right:  # 浮動小数点の精度の限界
+            break
         if condition(mid):
-            if not condition(mid - 1):
-                return mid
-            return search(left, mid)
+            right = mid
         else:
-            return search(mid, right)
+            left = mid
+    return right
 
-    if condition(initial_left):  # all True
-        return 0
-    elif not condition(initial_right):  # all False
+
+def _probe_until_decided(
+    executor: Executor, condition: Condition, points: Sequence[int]
+) -> Tuple[int, List[Optional[bool]]]:
+    """pointsを並列に評価し、F -> Tの境界が決まった時点で残りを取り消す
+
+    Returns:
+        Tuple[int, List[Optional[bool]]]: [False] + 結果 + [True]の中で
+            results[i]がFalse, results[i + 1]がTrueとなるi と 評価結果.
+            未評価の点はNone.
+    """
+    futures = {executor.submit(condition, p): i for i, p in enumerate(points)}
+    results: List[Optional[bool]] = [False] + [None] * len(points) + [True]
+    pending = set(futures)
+    try:
+        while True:
+            for i in range(len(results) - 1):
+                if results[i] is False and results[i + 1] is True:
+                    return i, results
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future] + 1] = bool(future.result())
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def kary_binary_search(
+    condition: Condition,
+    initial_left: int,
+    initial_right: int,
+    k: int = 4,
+    executor: Optional[Executor] = None,
+) -> Optional[int]:
+    """conditionの重い場合に、k - 1点を並列に評価して区間を1/kずつ狭める二分探索
+
+    結果はbinary_searchと同じ. ラウンド数はlog2(n)からlogk(n)に減る.
+    境界が決まった時点で、まだ始まっていない評価は取り消し、実行中の評価は結果を待たない.
+    ProcessPoolExecutorを使う場合、conditionはpickle可能でなければならない.
+
+    Args:
+        condition (Callable[[int], bool]):
+        initial_left (int):
+        initial_right (int):
+        k (int): 1ラウンドで区間を何分割するか. 2以上.
+        executor (Optional[Executor]): 省略時はk - 1スレッドのThreadPoolExecutorを使う.
+
+    Returns:
+        Optional[int]: binary_searchと同じ.
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    if executor is None:
+        own_executor = ThreadPoolExecutor(max_workers=k - 1)
+        try:
+            return kary_binary_search(
+                condition, initial_left, initial_right, k, own_executor
+            )
+        finally:
+            own_executor.shutdown(wait=False)
+    if initial_left >= initial_right:
+        return initial_left if condition(initial_left) else None
+    bounds = [initial_left, initial_right]
+    i, results = _probe_until_decided(executor, condition, bounds)
+    if i == 0:  # all True
+        return initial_left
+    if results[2] is False:  # all False
         return None
-    else:
-        return search(initial_left, initial_right)
+    left, right = bounds
+    while right - left > 1:
+        m = min(k - 1, right - left - 1)
+        points = [left + (right - left) * j // (m + 1) for j in range(1, m + 1)]
+        i, _ = _probe_until_decided(executor, condition, points)
+        left, right = ([left] + points + [right])[i:i + 2]
+    return right
+
+
+def parallel_binary_search(
+    queries: Sequence[Any],
+    initial_left: int,
+    initial_right: int,
+    reset: Callable[[], None],
+    advance: Callable[[int], None],
+    condition: Callable[[Any, int], bool],
+) -> List[Optional[int]]:
+    """共通の単調な過程に依存する多数のクエリの二分探索をまとめて行う (並列二分探索)
+
+    過程は時刻initial_leftの状態からadvance(t)で時刻tへ1ステップずつ進む.
+    condition(query, t)は時刻tの状態でクエリを判定し、各クエリについて
+    tに関して[FFFF...FTTTTT]となっているとする.
+    各ラウンドで全クエリの中点をsortし、過程を1回だけ最初から進めながら
+    中点に達したクエリを判定する. クエリ数をQ, 区間の長さをNとして、
+    計算量はQ回binary_searchするO(Q * N * log N)に対しO((N + Q) * log N).
+
+    Args:
+        queries (Sequence[Any]): conditionに渡すクエリ.
+        initial_left (int):
+        initial_right (int):
+        reset (Callable[[], None]): 過程を時刻initial_leftの状態に戻す.
+        advance (Callable[[int], None]): 時刻t - 1の状態から時刻tの状態へ進める.
+        condition (Callable[[Any, int], bool]):
+
+    Returns:
+        List[Optional[int]]: 各クエリについてbinary_searchと同じ値.
+    """
+    # 真の答えは(lefts[q], rights[q]]にある. 範囲外の両端は仮想的にFalse/True.
+    lefts = [initial_left - 1] * len(queries)
+    rights = [initial_right + 1] * len(queries)
+    while True:
+        active = [q for q in range(len(queries)) if rights[q] - lefts[q] > 1]
+        if not active:
+            break
+        mids = {q: (lefts[q] + rights[q]) // 2 for q in active}
+        active.sort(key=mids.__getitem__)
+        reset()
+        t = initial_left
+        for q in active:
+            while t < mids[q]:
+                t += 1
+                advance(t)
+            if condition(queries[q], mids[q]):
+                rights[q] = mids[q]
+            else:
+                lefts[q] = mids[q]
+    return [right if right <= initial_right else None for right in rights]
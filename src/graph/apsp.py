@@ -0,0 +1,122 @@
+import mmap
+from array import array
+from typing import Any, List, Optional, Tuple, Union
+
+from . import bfs
+from .base import Graph
+
+INF = float("inf")
+
+Buffer = Union["array[float]", "memoryview[float]"]
+
+
+class DistanceMatrix:
+    """Row-major ``size x size`` float64 distances; unreachable pairs hold ``inf``.
+
+    Backed by an in-memory array, or by a memory-mapped file when created with
+    a ``path`` so that large tables stay out of the heap.
+    """
+
+    def __init__(self, size: int, path: Optional[str] = None) -> None:
+        self.size = size
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        cells = size * size
+        if path is None:
+            self.data: Buffer = array("d", [INF]) * cells
+            return
+        with open(path, "w+b") as f:
+            f.truncate(max(cells, 1) * 8)
+            self._mmap = mmap.mmap(f.fileno(), 0)
+        self.data = memoryview(self._mmap).cast("d")
+        inf_row = array("d", [INF]) * size
+        for i in range(size):
+            self.set_row(i, inf_row)
+
+    def __getitem__(self, index: "Tuple[int, int]") -> float:
+        i, j = index
+        return self.data[i * self.size + j]
+
+    def __setitem__(self, index: "Tuple[int, int]", value: float) -> None:
+        i, j = index
+        self.data[i * self.size + j] = value
+
+    def row(self, i: int) -> "array":
+        start = i * self.size
+        return array("d", self.data[start:start + self.size])
+
+    def set_row(self, i: int, values: "array") -> None:
+        start = i * self.size
+        self.data[start:start + self.size] = values
+
+    def to_lists(self) -> "List[List[Optional[float]]]":
+        """Nested lists in the ``bfs.distances_from`` format (None if unreachable)."""
+        return [
+            [None if d == INF else d for d in self.row(i)] for i in range(self.size)
+        ]
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            if isinstance(self.data, memoryview):
+                self.data.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+def _edge_weight(weight: Any) -> float:
+    # same convention as bfs.distances_from: a missing weight counts as 0
+    return weight if weight else 0
+
+
+def floyd_warshall(graph: "Graph", path: Optional[str] = None) -> "DistanceMatrix":
+    """All-pairs shortest distances, relaxing a whole row per ``(k, i)`` step.
+
+    Negative weights are allowed; a negative cycle raises ValueError.
+    """
+    n = graph.size
+    dist = DistanceMatrix(n, path)
+    for i in range(n):
+        dist[i, i] = 0.0
+        for to, weight in graph.weighted_neighbors(i):
+            dist[i, to] = min(dist[i, to], _edge_weight(weight))
+    for k in range(n):
+        row_k = dist.row(k)
+        for i in range(n):
+            d_ik = dist[i, k]
+            if d_ik == INF:
+                continue
+            row_i = dist.row(i)
+            dist.set_row(i, array("d", map(min, row_i, map(d_ik.__add__, row_k))))
+    for i in range(n):
+        if dist[i, i] < 0:
+            dist.close()
+            raise ValueError("graph contains a negative cycle through %d" % i)
+    return dist
+
+
+def bfs_all_pairs(graph: "Graph", path: Optional[str] = None) -> "DistanceMatrix":
+    """One ``bfs.distances_from`` per source; exact for one non-negative weight."""
+    n = graph.size
+    dist = DistanceMatrix(n, path)
+    for i in range(n):
+        distances = bfs.distances_from(graph, i)
+        dist.set_row(i, array("d", (INF if d is None else d for d in distances)))
+    return dist
+
+
+def has_uniform_weights(graph: "Graph") -> bool:
+    return graph.uniform_weight()[0]
+
+
+def all_pairs_shortest_paths(
+    graph: "Graph", path: Optional[str] = None
+) -> "DistanceMatrix":
+    """Repeated BFS when all edges share one weight >= 0, else Floyd-Warshall."""
+    uniform, weight = graph.uniform_weight()
+    if uniform and _edge_weight(weight) >= 0:
+        return bfs_all_pairs(graph, path)
+    return floyd_warshall(graph, path)
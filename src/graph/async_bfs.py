@@ -0,0 +1,111 @@
+import asyncio
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .base import Graph
+
+Neighbors = List[Tuple[int, Any]]
+
+
+class AsyncGraph(metaclass=ABCMeta):
+    """Graph whose adjacency lives elsewhere and is fetched asynchronously."""
+
+    size: int
+
+    @abstractmethod
+    async def weighted_neighbors_many(
+        self, nodes: "Sequence[int]"
+    ) -> "Dict[int, Neighbors]":
+        """``{node: [(to, weight), ...]}`` for every requested node."""
+        pass
+
+    async def weighted_neighbors(self, from_: int) -> "Neighbors":
+        return (await self.weighted_neighbors_many([from_]))[from_]
+
+
+class InMemoryStore:
+    """Stand-in key-value store with a per-request latency, counting round trips."""
+
+    def __init__(self, data: "Mapping[int, Neighbors]", latency: float = 0.0):
+        self.data = data
+        self.latency = latency
+        self.round_trips = 0
+
+    @classmethod
+    def from_graph(cls, graph: "Graph", latency: float = 0.0) -> "InMemoryStore":
+        data = {
+            from_: list(graph.weighted_neighbors(from_)) for from_ in range(graph.size)
+        }
+        return cls(data, latency)
+
+    async def get_many(self, keys: "Sequence[int]") -> "Dict[int, Neighbors]":
+        self.round_trips += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return {key: list(self.data.get(key, ())) for key in keys}
+
+
+class KeyValueGraph(AsyncGraph):
+    """AsyncGraph over a store exposing ``async get_many(keys)``.
+
+    A lookup is split into requests of at most ``batch_size`` keys, of which at
+    most ``concurrency`` are in flight at once. The limit is created per lookup,
+    inside the running event loop, so one graph can serve several loops.
+    """
+
+    def __init__(
+        self, store: Any, size: int, batch_size: int = 256, concurrency: int = 8
+    ):
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be positive")
+        self.store = store
+        self.size = size
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    async def _fetch(
+        self, semaphore: "asyncio.Semaphore", keys: "Sequence[int]"
+    ) -> "Dict[int, Neighbors]":
+        async with semaphore:
+            result: Dict[int, Neighbors] = await self.store.get_many(keys)
+            return result
+
+    async def weighted_neighbors_many(
+        self, nodes: "Sequence[int]"
+    ) -> "Dict[int, Neighbors]":
+        size = self.batch_size
+        batches = [nodes[i:i + size] for i in range(0, len(nodes), size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        fetches = [self._fetch(semaphore, batch) for batch in batches]
+        merged: Dict[int, Neighbors] = {}
+        for result in await asyncio.gather(*fetches):
+            merged.update(result)
+        return merged
+
+
+async def distances_from(
+    graph: "AsyncGraph", from_: int, max_depth: Optional[int] = None
+) -> "List[int]":
+    """Async counterpart of ``bfs.distances_from``, fetching each frontier at once.
+
+    Nodes are expanded in the same order as the synchronous version, so the
+    result is identical, but a whole level costs one batched lookup instead of
+    one round trip per node. ``max_depth`` stops after that many levels.
+    """
+    distances: List = [None for _ in range(graph.size)]
+    distances[from_] = 0
+    frontier = [from_]
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        adjacency = await graph.weighted_neighbors_many(frontier)
+        next_frontier = []
+        for node in frontier:
+            cur_dist = distances[node]
+            for to, weight in adjacency[node]:
+                if distances[to] is not None:
+                    continue
+                distances[to] = cur_dist + (weight if weight else 0)
+                next_frontier.append(to)
+        frontier = next_frontier
+        depth += 1
+    return distances
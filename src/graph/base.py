@@ -1,40 +1,97 @@
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left, insort
+from operator import attrgetter
 
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+_get_to = attrgetter("to")
+_get_weight = attrgetter("weight")
 
 
 class Vertex:
-    __slots__ = ("data", "edges")
+    """A node holding its ordered out-edges.
+
+    With ``indexed=True`` (or after ``build_index``) a ``target -> Edge`` dict
+    makes duplicate checks and lookups O(1). The index is only kept in sync
+    through ``add_edge``/``remove_edge``; call ``build_index`` again after
+    editing ``edges`` directly.
+    """
 
-    def __init__(self, data=None):
+    __slots__ = ("data", "edges", "index")
+
+    def __init__(self, data: Any = None, indexed: bool = False) -> None:
         self.data = data
-        self.edges = []
+        self.edges: List[Edge] = []
+        self.index: Optional[Dict[int, Edge]] = {} if indexed else None
 
-    def add_edge(self, to, weight=None) -> bool:
+    def build_index(self) -> None:
+        self.index = {}
+        for edge in self.edges:
+            self.index.setdefault(edge.to, edge)
+
+    def get_edge(self, to: int) -> "Optional[Edge]":
+        if self.index is not None:
+            return self.index.get(to)
         for edge in self.edges:
             if edge.to == to:
-                return False
-        self.edges.append(Edge(to, weight))
+                return edge
+        return None
+
+    def add_edge(self, to: int, weight: Any = None) -> bool:
+        if self.get_edge(to) is not None:
+            return False
+        edge = Edge(to, weight)
+        self.edges.append(edge)
+        if self.index is not None:
+            self.index[to] = edge
         return True
 
     def remove_edge(self, to: int) -> bool:
-        for i, edge in enumerate(self.edges):
-            if edge.to == to:
-                del self.edges[i]
-                return True
-        return False
+        edge = self.get_edge(to)
+        if edge is None:
+            return False
+        if self.index is not None:
+            del self.index[to]
+        # identity scan in C; Edge does not define __eq__
+        self.edges.remove(edge)
+        return True
 
 
 class Edge:
     __slots__ = ("to", "weight")
 
-    def __init__(self, to, weight=None):
+    def __init__(self, to: int, weight: Any = None) -> None:
         self.to = to
         self.weight = weight
 
 
+EdgeListener = Callable[[bool, int, int, Any], None]
+
+
 class Graph(metaclass=ABCMeta):
     size: int
+    # bumped by every successful add_edge / remove_edge
+    version: int = 0
+    _listeners: "Tuple[EdgeListener, ...]" = ()
+
+    def subscribe(self, listener: "EdgeListener") -> None:
+        """Call ``listener(added, from_, to, weight)`` after each edge change.
+
+        ``weight`` is the new edge's weight on insertion and None on removal.
+        """
+        self._listeners = self._listeners + (listener,)
+
+    def unsubscribe(self, listener: "EdgeListener") -> None:
+        self._listeners = tuple(
+            other for other in self._listeners if other != listener
+        )
+
+    def _edge_changed(
+        self, added: bool, from_: int, to: int, weight: Any = None
+    ) -> None:
+        self.version += 1
+        for listener in self._listeners:
+            listener(added, from_, to, weight)
 
     @abstractmethod
     def get_weight(self, from_: int, to: int):
@@ -56,49 +113,152 @@ class Graph(metaclass=ABCMeta):
     def is_adjacent(self, from_: int, to: int) -> bool:
         pass
 
+    def neighbors(self, from_: int) -> "Iterable[int]":
+        """Targets of ``from_`` in ``edges_from`` order, without building Edges.
+
+        Backends return a view or iterator over their own storage; do not mutate
+        the graph while consuming it.
+        """
+        return [edge.to for edge in self.edges_from(from_)]
+
+    def weighted_neighbors(self, from_: int) -> "Iterable[Tuple[int, Any]]":
+        """``(to, weight)`` pairs of ``from_`` in ``edges_from`` order."""
+        return [(edge.to, edge.weight) for edge in self.edges_from(from_)]
+
+    def sources_to(self, to: int) -> "List[int]":
+        """Nodes with an edge into ``to``. Subclasses override the O(V + E) scan."""
+        return [
+            from_
+            for from_ in range(self.size)
+            if any(edge.to == to for edge in self.edges_from(from_))
+        ]
+
+    def weighted_sources_to(self, to: int) -> "Iterable[Tuple[int, Any]]":
+        """``(from_, weight)`` pairs in ``sources_to`` order."""
+        return [
+            (from_, self.get_weight(from_, to)) for from_ in self.sources_to(to)
+        ]
+
+    def degree(self, from_: int) -> int:
+        """Number of out-edges of ``from_``."""
+        return len(self.edges_from(from_))
+
+    def uniform_weight(self) -> "Tuple[bool, Any]":
+        """``(True, weight)`` if all edges share one weight, else ``(False, None)``.
+
+        A missing weight counts as 0. Subclasses override the O(V + E) scan.
+        """
+        seen = set()
+        for from_ in range(self.size):
+            for _, weight in self.weighted_neighbors(from_):
+                seen.add(weight if weight else 0)
+            if len(seen) > 1:
+                return False, None
+        return True, next(iter(seen), None)
+
 
 class AdjacentListGraph(Graph):
-    def __init__(self, vertices):
+    """Graph over a list of ``Vertex``.
+
+    The reverse adjacency behind ``sources_to`` and ``weighted_sources_to`` is
+    built on first use and dropped by ``add_edge``/``remove_edge``. Edits made
+    on a ``Vertex`` directly after that are not seen until the graph itself
+    changes.
+    """
+
+    def __init__(self, vertices, indexed: bool = False):
         self.vertices = vertices
         self.size = len(vertices)
+        if indexed:
+            for vertex in vertices:
+                vertex.build_index()
+        self._sources: Optional[List[List[int]]] = None
+        self._source_edges: Optional[List[List[Edge]]] = None
 
     def get_weight(self, from_: int, to: int):
-        for edge in self.vertices[from_].edges:
-            if edge.to == to:
-                return edge.weight
-        return None
+        edge = self.vertices[from_].get_edge(to)
+        return None if edge is None else edge.weight
 
     def edges_from(self, from_: int):
         return self.vertices[from_].edges
 
+    def neighbors(self, from_: int) -> "Iterable[int]":
+        return map(_get_to, self.vertices[from_].edges)
+
+    def weighted_neighbors(self, from_: int) -> "Iterable[Tuple[int, Any]]":
+        edges = self.vertices[from_].edges
+        return zip(map(_get_to, edges), map(_get_weight, edges))
+
     def add_edge(self, from_: int, to: int, weight=None) -> bool:
-        return self.vertices[from_].add_edge(to, weight)
+        if self.vertices[from_].add_edge(to, weight):
+            self._sources = self._source_edges = None
+            self._edge_changed(True, from_, to, weight)
+            return True
+        return False
 
     def remove_edge(self, from_: int, to: int) -> bool:
-        return self.vertices[from_].remove_edge(to)
+        if self.vertices[from_].remove_edge(to):
+            self._sources = self._source_edges = None
+            self._edge_changed(False, from_, to)
+            return True
+        return False
 
     def is_adjacent(self, from_: int, to: int) -> bool:
-        return to in {edge.to for edge in self.edges_from(from_)}
+        return self.vertices[from_].get_edge(to) is not None
+
+    def degree(self, from_: int) -> int:
+        return len(self.vertices[from_].edges)
+
+    def _reverse_index(self) -> "Tuple[List[List[int]], List[List[Edge]]]":
+        if self._sources is None or self._source_edges is None:
+            self._sources = [[] for _ in range(self.size)]
+            self._source_edges = [[] for _ in range(self.size)]
+            for from_, vertex in enumerate(self.vertices):
+                for edge in vertex.edges:
+                    sources = self._sources[edge.to]
+                    if not sources or sources[-1] != from_:
+                        sources.append(from_)
+                        self._source_edges[edge.to].append(edge)
+        return self._sources, self._source_edges
+
+    def sources_to(self, to: int) -> "List[int]":
+        sources, _ = self._reverse_index()
+        return list(sources[to])
+
+    def weighted_sources_to(self, to: int) -> "Iterable[Tuple[int, Any]]":
+        sources, edges = self._reverse_index()
+        return zip(sources[to], map(_get_weight, edges[to]))
 
 
 class AdjacentMatrixGraph(Graph):
-    def __init__(self, size):
+    def __init__(self, size: int) -> None:
         self.size = size
-        self.matrix = [[None for _ in range(size)] for _ in range(size)]
+        self.matrix: List[List[Any]] = [
+            [None for _ in range(size)] for _ in range(size)
+        ]
+        # sorted non-None columns per row, kept in sync by add_edge / remove_edge
+        self.targets: List[List[int]] = [[] for _ in range(size)]
 
     def get_weight(self, from_: int, to: int):
         return self.matrix[from_][to]
 
     def edges_from(self, from_: int):
-        return [
-            Edge(i, weight)
-            for i, weight in enumerate(self.matrix[from_])
-            if weight is not None
-        ]
+        row = self.matrix[from_]
+        return [Edge(i, row[i]) for i in self.targets[from_]]
+
+    def neighbors(self, from_: int) -> "Iterable[int]":
+        return self.targets[from_]
+
+    def weighted_neighbors(self, from_: int) -> "Iterable[Tuple[int, Any]]":
+        targets = self.targets[from_]
+        return zip(targets, map(self.matrix[from_].__getitem__, targets))
 
     def add_edge(self, from_: int, to: int, weight=None) -> bool:
         if self.matrix[from_][to] is None:
             self.matrix[from_][to] = weight
+            if weight is not None:
+                insort(self.targets[from_], to)
+                self._edge_changed(True, from_, to, weight)
             return True
         return False
 
@@ -107,8 +267,25 @@ class AdjacentMatrixGraph(Graph):
             return False
         if self.matrix[from_][to] is not None:
             self.matrix[from_][to] = None
+            targets = self.targets[from_]
+            del targets[bisect_left(targets, to)]
+            self._edge_changed(False, from_, to)
             return True
         return False
 
     def is_adjacent(self, from_: int, to: int) -> bool:
         return self.matrix[from_][to] is not None
+
+    def sources_to(self, to: int) -> "List[int]":
+        return [
+            from_ for from_ in range(self.size) if self.matrix[from_][to] is not None
+        ]
+
+    def weighted_sources_to(self, to: int) -> "Iterable[Tuple[int, Any]]":
+        column = [row[to] for row in self.matrix]
+        return [
+            (from_, weight) for from_, weight in enumerate(column) if weight is not None
+        ]
+
+    def degree(self, from_: int) -> int:
+        return len(self.targets[from_])
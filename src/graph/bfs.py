@@ -1,5 +1,5 @@
 from collections import deque
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .base import Graph
 
@@ -15,16 +15,43 @@ def distances_from(
         if break_if(node):
             break
         curDist = distances[node]
-        for edge in graph.edges_from(node):
-            if distances[edge.to] is not None:
+        for to, weight in graph.weighted_neighbors(node):
+            if distances[to] is not None:
                 continue
-            delta = edge.weight if edge.weight else 0
-            distances[edge.to] = curDist + delta
-            queue.append(edge.to)
+            delta = weight if weight else 0
+            distances[to] = curDist + delta
+            queue.append(to)
     return distances
 
 
-def shortest_path(graph: "Graph", from_: int, to: int) -> "List[int]":
+def bfs_tree(
+    graph: "Graph", from_: int
+) -> "Tuple[List[int], List[Optional[int]]]":
+    """``(distances_from(graph, from_), before_nodes)`` from a single traversal.
+
+    ``before_nodes`` holds the parent ``shortest_path`` would use for each node.
+    """
+    distances: List = [None for _ in range(graph.size)]
+    before_nodes: List[Optional[int]] = [None for _ in range(graph.size)]
+    distances[from_] = 0
+    queue = deque([from_])
+    while queue:
+        node = queue.popleft()
+        cur_dist = distances[node]
+        for to, weight in graph.weighted_neighbors(node):
+            if distances[to] is not None:
+                continue
+            distances[to] = cur_dist + (weight if weight else 0)
+            before_nodes[to] = node
+            queue.append(to)
+    return distances, before_nodes
+
+
+def shortest_path(
+    graph: "Graph", from_: int, to: int, bidirectional: bool = False
+) -> "List[int]":
+    if bidirectional:
+        return _bidirectional_shortest_path(graph, from_, to)
     before_nodes = [None for _ in range(graph.size)]
     queue = deque([from_])
     while queue:
@@ -36,9 +63,252 @@ def shortest_path(graph: "Graph", from_: int, to: int) -> "List[int]":
                 cur = before_nodes[cur]
                 path.appendleft(cur)
             return list(path)
-        for edge in graph.edges_from(node):
-            if before_nodes[edge.to] is not None:
+        for neighbor in graph.neighbors(node):
+            if before_nodes[neighbor] is not None:
                 continue
-            before_nodes[edge.to] = node
-            queue.append(edge.to)
+            before_nodes[neighbor] = node
+            queue.append(neighbor)
     return []
+
+
+def iter_levels(
+    graph: "Graph", from_: int, max_depth: Optional[int] = None, sparse: bool = False
+) -> "Iterator[List[int]]":
+    """Lazily yield BFS frontiers, starting with ``[from_]`` at depth 0.
+
+    Stops after depth ``max_depth`` if given. With ``sparse=True`` the visited
+    set is a hash set sized by what the traversal touches rather than a
+    ``graph.size`` bytearray, which pays off for small neighbourhoods of big
+    graphs.
+    """
+    frontier = [from_]
+    if sparse:
+        visited: Set[int] = {from_}
+    else:
+        flags = bytearray(graph.size)
+        flags[from_] = 1
+    depth = 0
+    while frontier:
+        yield frontier
+        if max_depth is not None and depth >= max_depth:
+            return
+        if sparse:
+            frontier = _next_level_sparse(graph, frontier, visited)
+        else:
+            frontier = _next_level_dense(graph, frontier, flags)
+        depth += 1
+
+
+def _next_level_sparse(
+    graph: "Graph", frontier: "List[int]", visited: "Set[int]"
+) -> "List[int]":
+    next_frontier = []
+    for node in frontier:
+        for neighbor in graph.neighbors(node):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                next_frontier.append(neighbor)
+    return next_frontier
+
+
+def _next_level_dense(
+    graph: "Graph", frontier: "List[int]", visited: bytearray
+) -> "List[int]":
+    next_frontier = []
+    for node in frontier:
+        for neighbor in graph.neighbors(node):
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                next_frontier.append(neighbor)
+    return next_frontier
+
+
+def iter_distances(
+    graph: "Graph", from_: int, max_depth: Optional[int] = None, sparse: bool = False
+) -> "Iterator[Tuple[int, int]]":
+    """Lazily yield ``(node, depth)`` in BFS order, where depth counts hops."""
+    for depth, frontier in enumerate(iter_levels(graph, from_, max_depth, sparse)):
+        for node in frontier:
+            yield node, depth
+
+
+def _expand_level(
+    frontier: "List[int]",
+    neighbors: "Callable[[int], Iterable[int]]",
+    parents: "Dict[int, Optional[int]]",
+    others: "Dict[int, Optional[int]]",
+) -> "Tuple[List[int], Optional[int]]":
+    next_frontier: List[int] = []
+    for node in frontier:
+        for neighbor in neighbors(node):
+            if neighbor in parents:
+                continue
+            parents[neighbor] = node
+            if neighbor in others:
+                return next_frontier, neighbor
+            next_frontier.append(neighbor)
+    return next_frontier, None
+
+
+def _bidirectional_shortest_path(graph: "Graph", from_: int, to: int) -> "List[int]":
+    # Expanding whole levels, always on the smaller side, the first node reached
+    # by both searches lies on a shortest path.
+    if from_ == to:
+        return [from_]
+    forward: Dict[int, Optional[int]] = {from_: None}
+    backward: Dict[int, Optional[int]] = {to: None}
+    forward_frontier, backward_frontier = [from_], [to]
+    meet = None
+    while forward_frontier and backward_frontier and meet is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meet = _expand_level(
+                forward_frontier, graph.neighbors, forward, backward
+            )
+        else:
+            backward_frontier, meet = _expand_level(
+                backward_frontier, graph.sources_to, backward, forward
+            )
+    if meet is None:
+        return []
+    path = deque([meet])
+    cur = forward[meet]
+    while cur is not None:
+        path.appendleft(cur)
+        cur = forward[cur]
+    cur = backward[meet]
+    while cur is not None:
+        path.append(cur)
+        cur = backward[cur]
+    return list(path)
+
+
+def direction_optimizing_distances_from(
+    graph: "Graph",
+    from_: int,
+    break_if: "Callable[[int], bool]" = lambda node: False,
+    alpha: float = 14.0,
+    beta: float = 24.0,
+) -> "List":
+    """Level-synchronous BFS switching between top-down and bottom-up steps.
+
+    A step goes bottom-up (every unvisited node looks for a parent in the
+    frontier through ``weighted_sources_to``) once the frontier's out-edges
+    exceed ``1 / alpha`` of the edges still unexplored, and returns to top-down
+    when the frontier shrinks below ``graph.size / beta`` nodes. Larger
+    ``alpha`` switches to bottom-up earlier; larger ``beta`` stays bottom-up
+    longer.
+
+    Bottom-up steps pick a parent per node rather than per frontier edge, which
+    only matches ``distances_from`` when all edges share one weight; any other
+    graph is handed to ``distances_from`` (use ``dijkstra`` for true shortest
+    paths there). Bottom-up steps
+    leave the frontier in node order, so when ``break_if`` fires the levels
+    since the last top-down step are replayed to recover the queue order
+    ``distances_from`` stops in; ``break_if`` should be a pure predicate.
+    """
+    uniform, _ = graph.uniform_weight()
+    if not uniform:
+        return distances_from(graph, from_, break_if)
+    size = graph.size
+    distances: List = [None for _ in range(size)]
+    distances[from_] = 0
+    visited = bytearray(size)
+    visited[from_] = 1
+    degrees = [graph.degree(node) for node in range(size)]
+    unexplored_edges = sum(degrees) - degrees[from_]
+    frontier = [from_]
+    # levels since the last frontier known to be in queue order
+    levels = [frontier]
+    bottom_up = False
+    while frontier:
+        cut = _break_index(frontier, break_if)
+        if cut < len(frontier) and len(levels) > 1:
+            frontier = _queue_order(graph, levels)
+            cut = _break_index(frontier, break_if)
+        if cut < len(frontier):
+            _top_down_step(graph, frontier[:cut], visited, distances)
+            break
+        frontier_edges = sum(degrees[node] for node in frontier)
+        if not bottom_up:
+            bottom_up = frontier_edges * alpha > unexplored_edges
+        elif len(frontier) * beta < size:
+            bottom_up = False
+        if bottom_up:
+            frontier = _bottom_up_step(graph, frontier, visited, distances)
+            levels.append(frontier)
+        else:
+            frontier = _top_down_step(graph, frontier, visited, distances)
+            if len(levels) > 1:
+                levels.append(frontier)
+            else:
+                levels = [frontier]
+        unexplored_edges -= sum(degrees[node] for node in frontier)
+    return distances
+
+
+def _break_index(frontier: "List[int]", break_if: "Callable[[int], bool]") -> int:
+    for i, node in enumerate(frontier):
+        if break_if(node):
+            return i
+    return len(frontier)
+
+
+def _queue_order(graph: "Graph", levels: "List[List[int]]") -> "List[int]":
+    """The last of ``levels`` in the order ``distances_from`` dequeues it.
+
+    ``levels[0]`` must already be in that order.
+    """
+    order = levels[0]
+    for level in levels[1:]:
+        pending = bytearray(graph.size)
+        for node in level:
+            pending[node] = 1
+        next_order = []
+        for node in order:
+            for to in graph.neighbors(node):
+                if pending[to]:
+                    pending[to] = 0
+                    next_order.append(to)
+        order = next_order
+    return order
+
+
+def _top_down_step(
+    graph: "Graph",
+    frontier: "List[int]",
+    visited: bytearray,
+    distances: "List",
+) -> "List[int]":
+    next_frontier = []
+    for node in frontier:
+        cur_dist = distances[node]
+        for to, weight in graph.weighted_neighbors(node):
+            if visited[to]:
+                continue
+            visited[to] = 1
+            distances[to] = cur_dist + (weight if weight else 0)
+            next_frontier.append(to)
+    return next_frontier
+
+
+def _bottom_up_step(
+    graph: "Graph",
+    frontier: "List[int]",
+    visited: bytearray,
+    distances: "List",
+) -> "List[int]":
+    in_frontier = bytearray(graph.size)
+    for node in frontier:
+        in_frontier[node] = 1
+    next_frontier = []
+    for node in range(graph.size):
+        if visited[node]:
+            continue
+        for parent, weight in graph.weighted_sources_to(node):
+            if in_frontier[parent]:
+                distances[node] = distances[parent] + (weight if weight else 0)
+                next_frontier.append(node)
+                break
+    for node in next_frontier:
+        visited[node] = 1
+    return next_frontier
@@ -0,0 +1,144 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import bfs
+from .base import Edge, Graph
+
+
+def iter_bits(bits: int) -> "Iterator[int]":
+    """Indices of the set bits of ``bits`` in increasing order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class BitsetMatrixGraph(Graph):
+    """Dense graph storing each row (and column) of the adjacency matrix as an int.
+
+    Python ints are packed bitsets, so a row costs ``size / 8`` bytes and whole
+    rows combine with C-level ``|``/``&``. Weights live in a flat typed array of
+    ``size * size`` cells, allocated on the first weighted ``add_edge``; an edge
+    added without a weight then reads back as 0.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.weights: Optional[array] = None
+        # number of edges per stored weight, so uniform_weight is O(1)
+        self._weight_counts: Dict[Any, int] = {}
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "BitsetMatrixGraph":
+        dense = cls(graph.size)
+        for from_ in range(graph.size):
+            for to, weight in graph.weighted_neighbors(from_):
+                dense.add_edge(from_, to, weight)
+        return dense
+
+    def _weight_at(self, from_: int, to: int) -> Any:
+        return None if self.weights is None else self.weights[from_ * self.size + to]
+
+    def _store_weight(self, from_: int, to: int, weight: Any) -> None:
+        if weight is not None or self.weights is not None:
+            if self.weights is None:
+                typecode = "q" if isinstance(weight, int) else "d"
+                self.weights = array(typecode, [0]) * (self.size * self.size)
+                # unweighted edges read back as 0 from now on
+                if None in self._weight_counts:
+                    self._weight_counts = {0: self._weight_counts[None]}
+            elif isinstance(weight, float) and self.weights.typecode == "q":
+                self.weights = array("d", self.weights)
+            self.weights[from_ * self.size + to] = weight if weight is not None else 0
+        self._count_weight(self._weight_at(from_, to), 1)
+
+    def _count_weight(self, weight: Any, delta: int) -> None:
+        count = self._weight_counts.get(weight, 0) + delta
+        if count:
+            self._weight_counts[weight] = count
+        else:
+            del self._weight_counts[weight]
+
+    def get_weight(self, from_: int, to: int) -> Any:
+        if not self.is_adjacent(from_, to):
+            return None
+        return self._weight_at(from_, to)
+
+    def edges_from(self, from_: int) -> "List[Edge]":
+        return [Edge(to, weight) for to, weight in self.weighted_neighbors(from_)]
+
+    def neighbors(self, from_: int) -> "Iterable[int]":
+        return iter_bits(self.rows[from_])
+
+    def weighted_neighbors(self, from_: int) -> "Iterable[Tuple[int, Any]]":
+        return ((to, self._weight_at(from_, to)) for to in iter_bits(self.rows[from_]))
+
+    def add_edge(self, from_: int, to: int, weight: Any = None) -> bool:
+        if self.is_adjacent(from_, to):
+            return False
+        self.rows[from_] |= 1 << to
+        self.cols[to] |= 1 << from_
+        self._store_weight(from_, to, weight)
+        self._edge_changed(True, from_, to, weight)
+        return True
+
+    def remove_edge(self, from_: int, to: int) -> bool:
+        if from_ >= self.size or to >= self.size:
+            return False
+        if not self.is_adjacent(from_, to):
+            return False
+        self._count_weight(self._weight_at(from_, to), -1)
+        self.rows[from_] &= ~(1 << to)
+        self.cols[to] &= ~(1 << from_)
+        self._edge_changed(False, from_, to)
+        return True
+
+    def is_adjacent(self, from_: int, to: int) -> bool:
+        return bool(self.rows[from_] >> to & 1)
+
+    def sources_to(self, to: int) -> "List[int]":
+        return list(iter_bits(self.cols[to]))
+
+    def weighted_sources_to(self, to: int) -> "Iterable[Tuple[int, Any]]":
+        sources = iter_bits(self.cols[to])
+        return ((from_, self._weight_at(from_, to)) for from_ in sources)
+
+    def degree(self, from_: int) -> int:
+        return bin(self.rows[from_]).count("1")
+
+    def uniform_weight(self) -> "Tuple[bool, Any]":
+        """``(True, weight)`` if all edges share one weight, else ``(False, None)``."""
+        if len(self._weight_counts) > 1:
+            return False, None
+        return True, next(iter(self._weight_counts), None)
+
+
+def levels_from(graph: "BitsetMatrixGraph", from_: int) -> "List[Optional[int]]":
+    """Hop count from ``from_``; each level is one OR over the frontier's rows."""
+    levels: List[Optional[int]] = [None for _ in range(graph.size)]
+    rows = graph.rows
+    visited = frontier = 1 << from_
+    level = 0
+    while frontier:
+        reached = 0
+        for node in iter_bits(frontier):
+            levels[node] = level
+            reached |= rows[node]
+        frontier = reached & ~visited
+        visited |= frontier
+        level += 1
+    return levels
+
+
+def distances_from(graph: "BitsetMatrixGraph", from_: int) -> "List":
+    """Same result as ``bfs.distances_from``, vectorized when weights are uniform."""
+    uniform, weight = graph.uniform_weight()
+    if not uniform:
+        return bfs.distances_from(graph, from_)
+    delta = weight if weight else 0
+    return [
+        None if level is None else level * delta
+        for level in levels_from(graph, from_)
+    ]
@@ -0,0 +1,72 @@
+from collections import OrderedDict, namedtuple
+from typing import List, Optional, Tuple
+
+from . import bfs
+from .base import Graph
+from .dijkstra import path_to
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "invalidations", "maxsize", "currsize"]
+)
+
+Tree = Tuple[List[int], List[Optional[int]]]
+
+
+class ShortestPathCache:
+    """LRU cache of per-source BFS trees, dropped whenever ``graph.version`` moves.
+
+    Answers are identical to ``bfs.distances_from`` / ``bfs.shortest_path``.
+    Backends bump ``version`` in ``add_edge``/``remove_edge``; edits that bypass
+    them (e.g. ``Vertex.add_edge`` on a vertex of an AdjacentListGraph) are not
+    seen, so call ``cache_clear`` after those.
+    """
+
+    def __init__(self, graph: "Graph", maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.graph = graph
+        self.maxsize = maxsize
+        self._trees: "OrderedDict[int, Tree]" = OrderedDict()
+        self._version = graph.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _tree(self, from_: int) -> "Tree":
+        if self.graph.version != self._version:
+            self.invalidations += len(self._trees)
+            self._trees.clear()
+            self._version = self.graph.version
+        tree = self._trees.get(from_)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(from_)
+            return tree
+        self.misses += 1
+        tree = bfs.bfs_tree(self.graph, from_)
+        self._trees[from_] = tree
+        if len(self._trees) > self.maxsize:
+            self._trees.popitem(last=False)
+            self.evictions += 1
+        return tree
+
+    def distances_from(self, from_: int) -> "List[int]":
+        return list(self._tree(from_)[0])
+
+    def shortest_path(self, from_: int, to: int) -> "List[int]":
+        return path_to(self._tree(from_)[1], from_, to)
+
+    def cache_info(self) -> "CacheInfo":
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.invalidations,
+            self.maxsize,
+            len(self._trees),
+        )
+
+    def cache_clear(self) -> None:
+        self._trees.clear()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
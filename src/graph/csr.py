@@ -0,0 +1,304 @@
+from array import array
+from itertools import repeat
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .base import AdjacentListGraph, AdjacentMatrixGraph, Edge, Graph, Vertex
+
+INDEX_TYPECODE = "q"
+
+EdgeTuple = Tuple[int, int, object]
+# typed arrays, or read-only memoryviews over shared or mapped buffers
+Storage = Union[array, memoryview]
+
+
+def _weight_typecode(weights: Sequence) -> Optional[str]:
+    """Pick the narrowest array typecode able to hold every weight."""
+    if all(weight is None for weight in weights):
+        return None
+    if all(weight is None or isinstance(weight, int) for weight in weights):
+        return "q"
+    return "d"
+
+
+def _dedupe_runs(size: int, offsets: array, targets: array, order: array) -> array:
+    """Drop repeated targets within each source's run, keeping the first.
+
+    ``targets`` and ``order`` are compacted in place; returns the new offsets.
+    """
+    last_source = array(INDEX_TYPECODE, [-1]) * size
+    new_offsets = array(INDEX_TYPECODE, [0]) * (size + 1)
+    write = 0
+    for from_ in range(size):
+        for position in range(offsets[from_], offsets[from_ + 1]):
+            to = targets[position]
+            if last_source[to] != from_:
+                last_source[to] = from_
+                targets[write] = to
+                order[write] = order[position]
+                write += 1
+        new_offsets[from_ + 1] = write
+    del targets[write:]
+    del order[write:]
+    return new_offsets
+
+
+class CSRGraph(Graph):
+    """Compressed sparse row graph.
+
+    Edges leaving ``v`` are ``targets[offsets[v]:offsets[v + 1]]`` with matching
+    ``weights``. ``weights`` is None when no edge carries a weight; otherwise an
+    edge added without a weight is stored as 0.
+    """
+
+    def __init__(
+        self,
+        offsets: "Storage",
+        targets: "Storage",
+        weights: "Optional[Storage]" = None,
+    ) -> None:
+        if len(offsets) == 0:
+            raise ValueError("offsets must hold at least one element")
+        if offsets[-1] != len(targets):
+            raise ValueError("offsets[-1] must equal the number of targets")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights and targets must have the same length")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.size = len(offsets) - 1
+        self._reverse: Optional[CSRGraph] = None
+        self._uniform: Optional[Tuple[bool, Any]] = None
+        self._views: Optional[Tuple[memoryview, Optional[memoryview]]] = None
+
+    @classmethod
+    def from_edges(cls, size: int, edges: Iterable[EdgeTuple]) -> "CSRGraph":
+        """Build from ``(from_, to, weight)`` triples.
+
+        Edge order per source is preserved and duplicated ``(from_, to)`` pairs
+        keep the first occurrence, as ``add_edge`` does on the other backends.
+        """
+        sources = array(INDEX_TYPECODE)
+        targets = array(INDEX_TYPECODE)
+        weights: List = []
+        for from_, to, weight in edges:
+            if not (0 <= from_ < size and 0 <= to < size):
+                raise IndexError("edge (%d, %d) out of range" % (from_, to))
+            sources.append(from_)
+            targets.append(to)
+            weights.append(weight)
+        return cls.from_arrays(size, sources, targets, weights, dedupe=True)
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "CSRGraph":
+        return cls.from_edges(
+            graph.size,
+            (
+                (from_, to, weight)
+                for from_ in range(graph.size)
+                for to, weight in graph.weighted_neighbors(from_)
+            ),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        size: int,
+        sources: Sequence[int],
+        targets: Sequence[int],
+        weights: List,
+        dedupe: bool = False,
+    ) -> "CSRGraph":
+        """Build from parallel edge columns.
+
+        ``weights`` may be empty when no edge carries a weight. With ``dedupe``
+        repeated ``(from_, to)`` pairs keep their first occurrence; this needs
+        O(V) extra memory instead of a set of every edge.
+        """
+        if not weights:
+            weights = [None] * len(targets)
+        # counting sort by source keeps the relative order of each source's edges
+        offsets = array(INDEX_TYPECODE, [0]) * (size + 1)
+        for from_ in sources:
+            offsets[from_ + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+        cursor = offsets[:-1]
+        sorted_targets = array(INDEX_TYPECODE, [0]) * len(targets)
+        order = array(INDEX_TYPECODE, [0]) * len(targets)
+        for i, from_ in enumerate(sources):
+            position = cursor[from_]
+            cursor[from_] = position + 1
+            sorted_targets[position] = targets[i]
+            order[position] = i
+        if dedupe:
+            offsets = _dedupe_runs(size, offsets, sorted_targets, order)
+        typecode = _weight_typecode(weights)
+        sorted_weights = None
+        if typecode is not None:
+            sorted_weights = array(
+                typecode, (weights[i] if weights[i] is not None else 0 for i in order)
+            )
+        return cls(offsets, sorted_targets, sorted_weights)
+
+    def to_list_graph(self) -> "AdjacentListGraph":
+        vertices = [Vertex() for _ in range(self.size)]
+        for from_, vertex in enumerate(vertices):
+            vertex.edges = self.edges_from(from_)
+        return AdjacentListGraph(vertices)
+
+    def to_matrix_graph(self) -> "AdjacentMatrixGraph":
+        """Copy into a matrix graph, where None means "no edge".
+
+        Unweighted edges are stored as 0, which traversals treat like None.
+        """
+        graph = AdjacentMatrixGraph(self.size)
+        for from_ in range(self.size):
+            row = graph.matrix[from_]
+            for to, weight in self.weighted_neighbors(from_):
+                row[to] = 0 if weight is None else weight
+            graph.targets[from_] = [to for to, w in enumerate(row) if w is not None]
+        return graph
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def _position(self, from_: int, to: int) -> Optional[int]:
+        for position in range(self.offsets[from_], self.offsets[from_ + 1]):
+            if self.targets[position] == to:
+                return position
+        return None
+
+    def _weight_at(self, position: int) -> Any:
+        return None if self.weights is None else self.weights[position]
+
+    def _storage_views(self) -> "Tuple[memoryview, Optional[memoryview]]":
+        """Memoryviews over ``targets`` and ``weights``; slicing them copies nothing."""
+        if self._views is None:
+            weights = self.weights
+            self._views = (
+                memoryview(self.targets),
+                None if weights is None else memoryview(weights),
+            )
+        return self._views
+
+    def _ensure_writable(self) -> "Tuple[array, array, Optional[array]]":
+        # arrays may be read-only buffers (e.g. memory-mapped), and slices handed
+        # out by neighbors() pin them against resizing; copy before writing
+        pinned = self._views is not None
+        self._views = None
+        if not isinstance(self.offsets, array):
+            self.offsets = array(INDEX_TYPECODE, self.offsets)
+        if pinned or not isinstance(self.targets, array):
+            self.targets = array(INDEX_TYPECODE, self.targets)
+        weights = self.weights
+        if isinstance(weights, memoryview):
+            weights = array(weights.format, weights)
+        elif pinned and weights is not None:
+            weights = array(weights.typecode, weights)
+        self.weights = weights
+        return self.offsets, self.targets, weights
+
+    def get_weight(self, from_: int, to: int) -> Any:
+        position = self._position(from_, to)
+        if position is None:
+            return None
+        return self._weight_at(position)
+
+    def edges_from(self, from_: int) -> "List[Edge]":
+        return [Edge(to, weight) for to, weight in self.weighted_neighbors(from_)]
+
+    def neighbors(self, from_: int) -> "Iterable[int]":
+        """A memoryview slice of ``targets``.
+
+        Mutating the graph moves it onto fresh arrays, so a slice taken earlier
+        keeps showing the old edges.
+        """
+        start, stop = self.offsets[from_], self.offsets[from_ + 1]
+        return self._storage_views()[0][start:stop]
+
+    def weighted_neighbors(self, from_: int) -> "Iterable[Tuple[int, Any]]":
+        start, stop = self.offsets[from_], self.offsets[from_ + 1]
+        targets, weights = self._storage_views()
+        if weights is None:
+            return zip(targets[start:stop], repeat(None))
+        return zip(targets[start:stop], weights[start:stop])
+
+    def add_edge(self, from_: int, to: int, weight: Any = None) -> bool:
+        """Append an edge in O(V + E). Prefer ``from_edges`` for bulk building."""
+        if self._position(from_, to) is not None:
+            return False
+        offsets, targets, weights = self._ensure_writable()
+        if weight is not None:
+            typecode = "q" if isinstance(weight, int) else "d"
+            if weights is not None and weights.typecode == "d":
+                typecode = "d"
+            # raises TypeError / OverflowError before any storage is touched
+            array(typecode, [weight])
+            if weights is None:
+                weights = array(typecode, [0]) * len(targets)
+            elif weights.typecode != typecode:
+                weights = array(typecode, weights)
+            self.weights = weights
+        position = offsets[from_ + 1]
+        targets.insert(position, to)
+        if weights is not None:
+            weights.insert(position, weight if weight is not None else 0)
+        for i in range(from_ + 1, self.size + 1):
+            offsets[i] += 1
+        self._reverse = None
+        self._uniform = None
+        self._edge_changed(True, from_, to, weight)
+        return True
+
+    def remove_edge(self, from_: int, to: int) -> bool:
+        if from_ >= self.size or to >= self.size:
+            return False
+        position = self._position(from_, to)
+        if position is None:
+            return False
+        offsets, targets, weights = self._ensure_writable()
+        del targets[position]
+        if weights is not None:
+            del weights[position]
+        for i in range(from_ + 1, self.size + 1):
+            offsets[i] -= 1
+        self._reverse = None
+        self._uniform = None
+        self._edge_changed(False, from_, to)
+        return True
+
+    def is_adjacent(self, from_: int, to: int) -> bool:
+        return self._position(from_, to) is not None
+
+    def reverse(self) -> "CSRGraph":
+        """The transposed graph, built once and cached until the next mutation."""
+        if self._reverse is None:
+            sources = array(INDEX_TYPECODE)
+            for from_ in range(self.size):
+                degree = self.offsets[from_ + 1] - self.offsets[from_]
+                sources.extend([from_] * degree)
+            weights = [] if self.weights is None else list(self.weights)
+            self._reverse = self.from_arrays(self.size, self.targets, sources, weights)
+        return self._reverse
+
+    def sources_to(self, to: int) -> "List[int]":
+        reverse = self.reverse()
+        start, stop = reverse.offsets[to], reverse.offsets[to + 1]
+        return list(reverse.targets[start:stop])
+
+    def weighted_sources_to(self, to: int) -> "Iterable[Tuple[int, Any]]":
+        return self.reverse().weighted_neighbors(to)
+
+    def degree(self, from_: int) -> int:
+        return self.offsets[from_ + 1] - self.offsets[from_]
+
+    def uniform_weight(self) -> "Tuple[bool, Any]":
+        """Scans the weight column once and caches until the next mutation."""
+        if self._uniform is None:
+            weights = set() if self.weights is None else set(self.weights)
+            if len(weights) > 1:
+                self._uniform = (False, None)
+            else:
+                self._uniform = (True, next(iter(weights), None))
+        return self._uniform
@@ -0,0 +1,114 @@
+import heapq
+from collections import deque
+from typing import Any, List, Optional, Tuple
+
+from .base import Graph
+
+ShortestPaths = Tuple[List, List[Optional[int]]]
+
+
+def edge_weight(weight: Any) -> Any:
+    # same convention as bfs.distances_from: a missing weight counts as 0
+    if not weight:
+        return 0
+    if weight < 0:
+        raise ValueError("negative edge weight: %r" % (weight,))
+    return weight
+
+
+def is_zero_one(graph: "Graph") -> bool:
+    return all(
+        edge_weight(weight) in (0, 1)
+        for from_ in range(graph.size)
+        for _, weight in graph.weighted_neighbors(from_)
+    )
+
+
+def dijkstra(graph: "Graph", from_: int, to: Optional[int] = None) -> "ShortestPaths":
+    """Binary-heap Dijkstra with lazy deletion.
+
+    Returns ``(distances, predecessors)``; unreachable nodes are None in both.
+    When ``to`` is given the search stops as soon as ``to`` is settled, so only
+    settled nodes are guaranteed to hold their final distance.
+    """
+    distances: List = [None for _ in range(graph.size)]
+    predecessors: List[Optional[int]] = [None for _ in range(graph.size)]
+    done = bytearray(graph.size)
+    distances[from_] = 0
+    heap = [(0, from_)]
+    while heap:
+        dist, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = 1
+        if node == to:
+            break
+        for neighbor, weight in graph.weighted_neighbors(node):
+            if done[neighbor]:
+                continue
+            new_dist = dist + edge_weight(weight)
+            if distances[neighbor] is None or new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                predecessors[neighbor] = node
+                heapq.heappush(heap, (new_dist, neighbor))
+    return distances, predecessors
+
+
+def zero_one_bfs(
+    graph: "Graph", from_: int, to: Optional[int] = None
+) -> "ShortestPaths":
+    """Deque-based shortest paths for graphs whose weights are all 0 or 1.
+
+    Same result format and early exit behaviour as ``dijkstra``.
+    """
+    distances: List = [None for _ in range(graph.size)]
+    predecessors: List[Optional[int]] = [None for _ in range(graph.size)]
+    done = bytearray(graph.size)
+    distances[from_] = 0
+    queue = deque([from_])
+    while queue:
+        node = queue.popleft()
+        if done[node]:
+            continue
+        done[node] = 1
+        if node == to:
+            break
+        dist = distances[node]
+        for neighbor, weight in graph.weighted_neighbors(node):
+            if done[neighbor]:
+                continue
+            weight = edge_weight(weight)
+            if weight not in (0, 1):
+                raise ValueError("edge weight is neither 0 nor 1: %r" % (weight,))
+            new_dist = dist + weight
+            if distances[neighbor] is None or new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                predecessors[neighbor] = node
+                if weight:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+    return distances, predecessors
+
+
+def shortest_distances(
+    graph: "Graph", from_: int, to: Optional[int] = None
+) -> "ShortestPaths":
+    """Dispatch to ``zero_one_bfs`` when every weight is 0 or 1, else ``dijkstra``."""
+    if is_zero_one(graph):
+        return zero_one_bfs(graph, from_, to)
+    return dijkstra(graph, from_, to)
+
+
+def path_to(predecessors: "List[Optional[int]]", from_: int, to: int) -> "List[int]":
+    """Rebuild the ``from_ -> to`` path, in the same format as bfs.shortest_path."""
+    if to != from_ and predecessors[to] is None:
+        return []
+    path = deque([to])
+    cur = to
+    while cur != from_:
+        parent = predecessors[cur]
+        assert parent is not None
+        cur = parent
+        path.appendleft(cur)
+    return list(path)
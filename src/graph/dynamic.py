@@ -0,0 +1,109 @@
+import heapq
+from typing import Any, Dict, List, Optional, Set
+
+from . import dijkstra
+from .base import Graph
+
+
+class DynamicDistances:
+    """Single-source shortest distances kept current while the graph changes.
+
+    Subscribes to ``graph`` and repairs only what an edge change can affect:
+    an insertion propagates decreases outward from the edge's head, a deletion
+    of a shortest-path-tree edge re-derives the subtree hanging below it.
+    Distances follow ``dijkstra.dijkstra``: unreachable nodes are None and a
+    missing weight counts as 0. Call ``close`` to stop listening.
+
+    Keeps its own reverse adjacency, updated from the change events, so a
+    deletion does not rebuild the backend's ``sources_to`` index.
+    """
+
+    def __init__(self, graph: "Graph", source: int):
+        self.graph = graph
+        self.source = source
+        self._distances, self._parents = dijkstra.dijkstra(graph, source)
+        # parent -> edge weight, per node
+        self._sources: List[Dict[int, Any]] = [{} for _ in range(graph.size)]
+        for from_ in range(graph.size):
+            for to, weight in graph.weighted_neighbors(from_):
+                self._sources[to][from_] = dijkstra.edge_weight(weight)
+        graph.subscribe(self._on_edge_changed)
+
+    @property
+    def distances(self) -> "List":
+        return self._distances
+
+    @property
+    def parents(self) -> "List[Optional[int]]":
+        return self._parents
+
+    def path_to(self, to: int) -> "List[int]":
+        return dijkstra.path_to(self._parents, self.source, to)
+
+    def close(self) -> None:
+        self.graph.unsubscribe(self._on_edge_changed)
+
+    def _on_edge_changed(self, added: bool, from_: int, to: int, weight: Any) -> None:
+        if added:
+            weight = dijkstra.edge_weight(weight)
+            self._sources[to][from_] = weight
+            self._edge_inserted(from_, to, weight)
+            return
+        self._sources[to].pop(from_, None)
+        if self._parents[to] == from_:
+            self._tree_edge_removed(to)
+
+    def _edge_inserted(self, from_: int, to: int, weight: Any) -> None:
+        if self._distances[from_] is None:
+            return
+        new_dist = self._distances[from_] + weight
+        if self._distances[to] is not None and new_dist >= self._distances[to]:
+            return
+        self._distances[to] = new_dist
+        self._parents[to] = from_
+        self._propagate([(new_dist, to)])
+
+    def _tree_edge_removed(self, root: int) -> None:
+        affected = self._subtree(root)
+        for node in affected:
+            self._distances[node] = None
+            self._parents[node] = None
+        heap = []
+        for node in affected:
+            for parent, weight in self._sources[node].items():
+                dist = self._distances[parent]
+                if dist is None:
+                    continue
+                new_dist = dist + weight
+                if self._distances[node] is None or new_dist < self._distances[node]:
+                    self._distances[node] = new_dist
+                    self._parents[node] = parent
+            if self._distances[node] is not None:
+                heap.append((self._distances[node], node))
+        heapq.heapify(heap)
+        self._propagate(heap)
+
+    def _subtree(self, root: int) -> "Set[int]":
+        subtree = {root}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for child in self.graph.neighbors(node):
+                if self._parents[child] == node and child not in subtree:
+                    subtree.add(child)
+                    stack.append(child)
+        return subtree
+
+    def _propagate(self, heap: "List") -> None:
+        # Dijkstra seeded with the changed nodes; untouched nodes stay settled
+        while heap:
+            dist, node = heapq.heappop(heap)
+            if dist != self._distances[node]:
+                continue
+            for neighbor, weight in self.graph.weighted_neighbors(node):
+                new_dist = dist + dijkstra.edge_weight(weight)
+                current = self._distances[neighbor]
+                if current is None or new_dist < current:
+                    self._distances[neighbor] = new_dist
+                    self._parents[neighbor] = node
+                    heapq.heappush(heap, (new_dist, neighbor))
@@ -0,0 +1,190 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .base import Graph
+from .csr import INDEX_TYPECODE, CSRGraph
+
+EdgeChunk = Tuple[array, array, List]
+
+MAGIC = b"CSRG"
+FORMAT_VERSION = 1
+# magic, format version, size, edge count, weight typecode, byte order, padding
+HEADER = struct.Struct("<4sIQQcc6x")
+NO_WEIGHTS = b"-"
+
+
+def _parse_weight(text: str) -> "Union[int, float]":
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _is_header(fields: "List[str]") -> bool:
+    """True when no field parses as a number, e.g. ``from,to,weight``."""
+    for field in fields:
+        try:
+            _parse_weight(field)
+        except ValueError:
+            continue
+        return False
+    return True
+
+
+def _edge_weight(fields: "List[str]", line_number: int) -> "Union[int, float, None]":
+    if len(fields) < 3:
+        return None
+    try:
+        return _parse_weight(fields[2])
+    except ValueError:
+        raise ValueError(
+            "malformed weight on line %d: %r" % (line_number, fields[2])
+        ) from None
+
+
+def iter_edge_chunks(
+    lines: "Iterable[str]",
+    chunk_size: int = 1 << 16,
+    delimiter: Optional[str] = None,
+    comment: str = "#",
+) -> "Iterator[EdgeChunk]":
+    """Parse ``from to [weight]`` lines into ``(sources, targets, weights)`` chunks.
+
+    ``sources``/``targets`` are typed arrays of at most ``chunk_size`` edges;
+    ``weights`` is empty for a chunk whose lines carry no weight column. Blank
+    lines and ``comment`` lines are skipped, as is the first remaining line when
+    none of its fields is a number, so both whitespace edge lists and CSV
+    (``delimiter=","``) with a header work.
+    """
+    sources, targets = array(INDEX_TYPECODE), array(INDEX_TYPECODE)
+    weights: List = []
+    weighted = False
+    first = True
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith(comment):
+            continue
+        fields = line.split(delimiter)
+        header, first = first and _is_header(fields), False
+        if header:
+            continue
+        try:
+            from_, to = int(fields[0]), int(fields[1])
+        except (IndexError, ValueError):
+            raise ValueError(
+                "malformed edge on line %d: %r" % (line_number, line)
+            ) from None
+        if len(fields) > 2 and not weighted:
+            weights, weighted = [None] * len(sources), True
+        sources.append(from_)
+        targets.append(to)
+        if weighted:
+            weights.append(_edge_weight(fields, line_number))
+        if len(sources) >= chunk_size:
+            yield sources, targets, weights
+            sources, targets = array(INDEX_TYPECODE), array(INDEX_TYPECODE)
+            weights, weighted = [], False
+    if sources:
+        yield sources, targets, weights
+
+
+def read_edge_list(
+    file: "IO[str]",
+    size: Optional[int] = None,
+    kind: str = "csr",
+    chunk_size: int = 1 << 16,
+    delimiter: Optional[str] = None,
+) -> "Graph":
+    """Load an edge list into a ``"csr"``, ``"list"`` or ``"matrix"`` graph.
+
+    ``size`` defaults to the largest node id + 1; a node id outside
+    ``[0, size)`` raises ValueError. Repeated ``(from_, to)`` pairs keep their
+    first weight, as ``add_edge`` would.
+    """
+    sources, targets = array(INDEX_TYPECODE), array(INDEX_TYPECODE)
+    weights: List = []
+    weighted = False
+    low, high = 0, -1
+    for chunk_sources, chunk_targets, chunk_weights in iter_edge_chunks(
+        file, chunk_size, delimiter
+    ):
+        low = min(low, min(chunk_sources), min(chunk_targets))
+        high = max(high, max(chunk_sources), max(chunk_targets))
+        if chunk_weights and not weighted:
+            weights, weighted = [None] * len(sources), True
+        if weighted:
+            weights.extend(chunk_weights or [None] * len(chunk_sources))
+        sources.extend(chunk_sources)
+        targets.extend(chunk_targets)
+    if size is None:
+        size = high + 1
+    if low < 0 or high >= size:
+        bad = low if low < 0 else high
+        raise ValueError("node id %d out of range for size %d" % (bad, size))
+    csr = CSRGraph.from_arrays(size, sources, targets, weights, dedupe=True)
+    return convert(csr, kind)
+
+
+def convert(graph: "CSRGraph", kind: str) -> "Graph":
+    """Re-home a CSR graph in another backend without per-edge ``add_edge`` calls."""
+    if kind == "csr":
+        return graph
+    if kind == "list":
+        return graph.to_list_graph()
+    if kind == "matrix":
+        return graph.to_matrix_graph()
+    raise ValueError("unknown graph kind: %r" % (kind,))
+
+
+def save_binary(graph: "Graph", file: "IO[bytes]") -> None:
+    """Write the graph's CSR arrays in the format read by ``load_binary``."""
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    typecode = NO_WEIGHTS
+    if isinstance(csr.weights, array):
+        typecode = csr.weights.typecode.encode()
+    elif csr.weights is not None:
+        typecode = csr.weights.format.encode()
+    byteorder = b"l" if sys.byteorder == "little" else b"b"
+    header = (MAGIC, FORMAT_VERSION, csr.size, csr.edge_count, typecode, byteorder)
+    file.write(HEADER.pack(*header))
+    file.write(array(INDEX_TYPECODE, csr.offsets).tobytes())
+    file.write(array(INDEX_TYPECODE, csr.targets).tobytes())
+    if csr.weights is not None:
+        file.write(array(typecode.decode(), csr.weights).tobytes())
+
+
+def load_binary(path: str, use_mmap: bool = True) -> "CSRGraph":
+    """Open a file written by ``save_binary``.
+
+    With ``use_mmap`` the arrays are read-only views over a memory map, so
+    opening costs O(1) and pages load on demand; the first mutation copies them
+    into memory.
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            buffer = memoryview(f.read())
+    magic, version, size, edge_count, typecode, byteorder = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("%s is not a CSR graph file" % path)
+    if byteorder != (b"l" if sys.byteorder == "little" else b"b"):
+        raise ValueError("%s was written on a machine of other byte order" % path)
+    position = HEADER.size
+    offsets, position = _take(buffer, position, INDEX_TYPECODE, size + 1)
+    targets, position = _take(buffer, position, INDEX_TYPECODE, edge_count)
+    weights = None
+    if typecode != NO_WEIGHTS:
+        weights, position = _take(buffer, position, typecode.decode(), edge_count)
+    return CSRGraph(offsets, targets, weights)
+
+
+def _take(
+    buffer: memoryview, position: int, typecode: str, count: int
+) -> "Tuple[memoryview, int]":
+    end = position + 8 * count
+    view: memoryview = buffer[position:end].cast(typecode)  # type: ignore
+    return view, end
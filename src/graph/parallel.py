@@ -0,0 +1,130 @@
+from array import array
+from multiprocessing import Pool
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None  # type: ignore
+
+from . import bfs
+from .base import Graph
+from .csr import CSRGraph
+
+# (shared memory name, element count, typecode) per CSR array
+ArraySpec = Tuple[str, int, str]
+GraphSpec = Tuple[ArraySpec, ArraySpec, Optional[ArraySpec]]
+CSRArrays = Tuple[array, array, Optional[array]]
+
+_worker_blocks: "List[shared_memory.SharedMemory]" = []
+_worker_graph: Optional[CSRGraph] = None
+
+
+def _csr_arrays(graph: "Graph") -> "CSRArrays":
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    weights = None
+    if isinstance(csr.weights, array):
+        weights = array(csr.weights.typecode, csr.weights)
+    elif csr.weights is not None:
+        weights = array(csr.weights.format, csr.weights)
+    return array("q", csr.offsets), array("q", csr.targets), weights
+
+
+class SharedCSRGraph:
+    """Copies a graph's CSR arrays into shared memory blocks once.
+
+    Workers attach to the blocks by name through ``spec`` instead of receiving a
+    pickled graph. Use as a context manager so the blocks are unlinked.
+    Needs ``multiprocessing.shared_memory`` (Python 3.8+).
+    """
+
+    def __init__(self, graph: "Graph") -> None:
+        if shared_memory is None:
+            raise RuntimeError("SharedCSRGraph needs Python 3.8 or later")
+        self._blocks: List[shared_memory.SharedMemory] = []
+        offsets, targets, weights = _csr_arrays(graph)
+        self.spec: GraphSpec = (
+            self._share(offsets),
+            self._share(targets),
+            None if weights is None else self._share(weights),
+        )
+
+    def _share(self, values: "array") -> "ArraySpec":
+        # zero-sized blocks are not allowed; keep at least one whole item
+        size = len(values) * values.itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(size, values.itemsize))
+        assert block.buf is not None
+        block.buf[:size] = values.tobytes()
+        self._blocks.append(block)
+        return block.name, len(values), values.typecode
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedCSRGraph":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _attach_array(spec: "ArraySpec") -> memoryview:
+    name, length, typecode = spec
+    block = shared_memory.SharedMemory(name=name)
+    _worker_blocks.append(block)
+    assert block.buf is not None
+    # blocks may be rounded up to a page, which need not be a whole item count
+    size = length * array(typecode).itemsize
+    return block.buf[:size].cast(typecode)  # type: ignore
+
+
+def attach(spec: "GraphSpec") -> "CSRGraph":
+    """Read-only CSRGraph view over the shared blocks described by ``spec``."""
+    offsets, targets, weights = spec
+    return CSRGraph(
+        _attach_array(offsets),
+        _attach_array(targets),
+        None if weights is None else _attach_array(weights),
+    )
+
+
+def _init_worker(spec: "GraphSpec") -> None:
+    global _worker_graph
+    _worker_graph = attach(spec)
+
+
+def _init_worker_with_arrays(arrays: "CSRArrays") -> None:
+    global _worker_graph
+    _worker_graph = CSRGraph(*arrays)
+
+
+def _distances_from_source(source: int) -> "Tuple[int, List[int]]":
+    assert _worker_graph is not None
+    return source, bfs.distances_from(_worker_graph, source)
+
+
+def distances_from_many(
+    graph: "Graph",
+    sources: "Iterable[int]",
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> "Iterator[Tuple[int, List[int]]]":
+    """Yield ``(source, bfs.distances_from(graph, source))`` as each source finishes.
+
+    The graph is snapshotted into shared memory when iteration starts; later
+    mutations are not seen. Without ``multiprocessing.shared_memory`` each
+    worker receives a pickled copy of the CSR arrays instead. ``workers``
+    defaults to ``os.cpu_count()`` and ``chunksize`` sources are sent to a
+    worker at a time.
+    """
+    if shared_memory is None:
+        initargs = (_csr_arrays(graph),)
+        with Pool(workers, _init_worker_with_arrays, initargs) as pool:
+            yield from pool.imap_unordered(_distances_from_source, sources, chunksize)
+        return
+    with SharedCSRGraph(graph) as shared:
+        with Pool(workers, initializer=_init_worker, initargs=(shared.spec,)) as pool:
+            yield from pool.imap_unordered(_distances_from_source, sources, chunksize)
@@ -0,0 +1,72 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .base import Graph
+
+
+class UnionFind:
+    """Disjoint sets over ``0..size-1`` with union by size and path compression.
+
+    Parents and set sizes are flat typed arrays. Edges are treated as
+    undirected, so components are the weakly connected components of a Graph.
+    """
+
+    def __init__(self, size: int):
+        self.parent = array("q", range(size))
+        self.sizes = array("q", [1]) * size
+        self.count = size
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "UnionFind":
+        union_find = cls(graph.size)
+        for from_ in range(graph.size):
+            for to in graph.neighbors(from_):
+                union_find.union(from_, to)
+        return union_find
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of ``a`` and ``b``; False if they were already one set."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.sizes[a] += self.sizes[b]
+        self.count -= 1
+        return True
+
+    def add_edge(self, from_: int, to: int, weight: Any = None) -> bool:
+        return self.union(from_, to)
+
+    def add_edges(self, edges: "Iterable[Tuple[int, int]]") -> int:
+        """Union every pair; returns how many of them merged two sets."""
+        return sum(self.union(a, b) for a, b in edges)
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def connected_many(self, pairs: "Iterable[Tuple[int, int]]") -> "List[bool]":
+        find = self.find
+        return [find(a) == find(b) for a, b in pairs]
+
+    def component_size(self, x: int) -> int:
+        return self.sizes[self.find(x)]
+
+    def labels(self) -> "List[int]":
+        """Component ids ``0..count-1``, numbered by each component's first node."""
+        ids: Dict[int, int] = {}
+        return [ids.setdefault(self.find(x), len(ids)) for x in range(len(self.parent))]
+
+
+def component_labels(graph: "Graph") -> "List[int]":
+    return UnionFind.from_graph(graph).labels()
@@ -0,0 +1,283 @@
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Collection
+from heapq import merge
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .sorted_collection import ItemGetter, NumericSortedCollection
+
+MAGIC = b"SCOL"
+FORMAT_VERSION = 1
+# magic, format version, item count, key typecode, byte order, padding
+HEADER = struct.Struct("<4sIQcc6x")
+BYTE_ORDER = b"l" if sys.byteorder == "little" else b"b"
+
+Record = Tuple[Any, Any]
+
+
+def write_file(
+    path: str, typecode: str, count: int, records: "Iterable[Record]"
+) -> None:
+    """Write ``count`` sorted ``(key, pickled item)`` records to ``path``.
+
+    Layout: header, ``count`` keys, ``count + 1`` item offsets, item bytes.
+    Records are streamed, so only the keys and offsets are held in memory.
+    """
+    keys = array(typecode)
+    offsets = array("q", [0])
+    with open(path, "wb") as f:
+        f.seek(HEADER.size + 8 * count + 8 * (count + 1))
+        for k, blob in records:
+            keys.append(k)
+            f.write(blob)
+            offsets.append(offsets[-1] + len(blob))
+        if len(keys) != count:
+            raise ValueError("expected %d records, got %d" % (count, len(keys)))
+        f.seek(0)
+        f.write(
+            HEADER.pack(MAGIC, FORMAT_VERSION, count, typecode.encode(), BYTE_ORDER)
+        )
+        f.write(keys.tobytes())
+        f.write(offsets.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def stored_typecode(path: str) -> Optional[str]:
+    "Key typecode recorded in the header of ``path``, or None if it has none"
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    typecode: bytes
+    magic, version, _, typecode, _ = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return typecode.decode()
+
+
+class PersistentSortedCollection(Collection):
+    """Sorted index stored in a memory-mapped file, for data larger than RAM.
+
+    The file holds fixed-width keys (``typecode`` "d" or "q"), offsets into a
+    region of pickled items, and the items. Opening maps the file without
+    reading it, and ``find``/``index``/``count`` bisect the mapped keys.
+    ``typecode`` defaults to the one in an existing file, else "d"; int keys
+    a double cannot hold exactly are then rejected with OverflowError.
+
+    Inserts go to an in-memory buffer. Once it holds ``buffer_size`` items, or
+    on ``flush``/``close``, it is merged with the file into a new one that
+    replaces the old with ``os.replace``. Removing a stored item leaves a
+    tombstone until the next merge. Among equal keys stored items come first.
+    ``key`` must be the function the file was written with.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: ItemGetter,
+        typecode: Optional[str] = None,
+        buffer_size: int = 4096,
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        if typecode is None:
+            if os.path.exists(path):
+                typecode = stored_typecode(path)
+            typecode = typecode or "d"
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer = NumericSortedCollection([], key, typecode)
+        # file positions removed since the last merge, sorted
+        self._deleted: List[int] = []
+        self._mmap: Optional[mmap.mmap] = None
+        if not os.path.exists(path):
+            write_file(path, typecode, 0, ())
+        self._open()
+
+    @property
+    def key(self) -> ItemGetter:
+        return self._buffer.key
+
+    @property
+    def typecode(self) -> str:
+        return self._buffer.typecode
+
+    def _open(self) -> None:
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, count, typecode, byteorder = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._views = [view]
+            self._unmap()
+            raise ValueError("%s is not a sorted collection file" % self.path)
+        if typecode.decode() != self.typecode or byteorder != BYTE_ORDER:
+            self._views = [view]
+            self._unmap()
+            raise ValueError(
+                "%s holds %r keys in byte order %r" % (self.path, typecode, byteorder)
+            )
+        start = HEADER.size
+        data_start = start + 8 * count + 8 * (count + 1)
+        self._keys = view[start:start + 8 * count].cast(self.typecode)  # type: ignore
+        self._offsets = view[start + 8 * count:data_start].cast("q")
+        self._data = view[data_start:]
+        self._views = [self._keys, self._offsets, self._data, view]
+
+    def _unmap(self) -> None:
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "PersistentSortedCollection":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        "Merge the buffer and tombstones into the file"
+        if not self._buffer and not self._deleted:
+            return
+        buffered = (
+            (k, pickle.dumps(item, pickle.HIGHEST_PROTOCOL))
+            for k, item in zip(self._buffer.keys, self._buffer.items)
+        )
+        records = merge(self._iter_stored(self._blob), buffered, key=itemgetter(0))
+        tmp_path = self.path + ".tmp"
+        write_file(tmp_path, self.typecode, len(self), records)
+        self._unmap()
+        os.replace(tmp_path, self.path)
+        self._open()
+        self._buffer.clear()
+        self._deleted = []
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self.flush()
+            self._unmap()
+
+    # Stored records
+
+    def _blob(self, p: int) -> memoryview:
+        return self._data[self._offsets[p]:self._offsets[p + 1]]
+
+    def _stored_item(self, p: int) -> Any:
+        return pickle.loads(self._blob(p))
+
+    def _iter_stored(self, load: "Callable[[int], Any]") -> "Iterator[Record]":
+        deleted = set(self._deleted)
+        for p in range(len(self._keys)):
+            if p not in deleted:
+                yield self._keys[p], load(p)
+
+    def _next_live(self, p: int) -> int:
+        "First stored position >= p without a tombstone"
+        i = bisect_left(self._deleted, p)
+        while i < len(self._deleted) and self._deleted[i] == p:
+            i += 1
+            p += 1
+        return p
+
+    def _prev_live(self, p: int) -> int:
+        "Last stored position <= p without a tombstone, or -1"
+        i = bisect_right(self._deleted, p) - 1
+        while i >= 0 and self._deleted[i] == p:
+            i -= 1
+            p -= 1
+        return p
+
+    def _live_between(self, i: int, j: int) -> int:
+        return (j - i) - (bisect_left(self._deleted, j) - bisect_left(self._deleted, i))
+
+    # Merged view of the file and the buffer
+
+    def _first_from(self, p: int, q: int) -> "Optional[Record]":
+        "First item at or after stored position p and buffer position q"
+        p = self._next_live(p)
+        buffer = self._buffer
+        if q < len(buffer) and (p >= len(self._keys) or buffer.keys[q] < self._keys[p]):
+            return buffer.keys[q], buffer.items[q]
+        if p < len(self._keys):
+            return self._keys[p], self._stored_item(p)
+        return None
+
+    def _last_before(self, p: int, q: int) -> "Optional[Record]":
+        "Last item before stored position p and buffer position q"
+        p = self._prev_live(p - 1)
+        buffer = self._buffer
+        if q > 0 and (p < 0 or buffer.keys[q - 1] >= self._keys[p]):
+            return buffer.keys[q - 1], buffer.items[q - 1]
+        if p >= 0:
+            return self._keys[p], self._stored_item(p)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._deleted) + len(self._buffer)
+
+    def __iter__(self) -> Iterator:
+        buffered = zip(self._buffer.keys, self._buffer.items)
+        stored = self._iter_stored(self._stored_item)
+        return map(itemgetter(1), merge(stored, buffered, key=itemgetter(0)))
+
+    def __contains__(self, item: Any) -> bool:
+        k = self.key(item)
+        i, j = bisect_left(self._keys, k), bisect_right(self._keys, k)
+        deleted = set(self._deleted)
+        for p in range(i, j):
+            if p not in deleted and self._stored_item(p) == item:
+                return True
+        return item in self._buffer
+
+    def index(self, k: Any) -> int:
+        "Find the position of an item.  Raise ValueError if not found."
+        if not self.count(k):
+            raise ValueError("%r is not in collection" % (k,))
+        i = bisect_left(self._keys, k)
+        return self._live_between(0, i) + self._buffer.rank(k)
+
+    def count(self, k: Any) -> int:
+        "Return number of occurrences of item"
+        i, j = bisect_left(self._keys, k), bisect_right(self._keys, k)
+        return self._live_between(i, j) + self._buffer.count(k)
+
+    def insert(self, item: Any) -> None:
+        "Insert a new item after those with equal keys.  May trigger a merge"
+        self._buffer.insert_right(item)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def remove(self, k: Any) -> None:
+        "Remove first occurence of item.  Raise ValueError if not found"
+        p = self._next_live(bisect_left(self._keys, k))
+        if p < len(self._keys) and self._keys[p] == k:
+            insort(self._deleted, p)
+            if len(self._deleted) >= self.buffer_size:
+                self.flush()
+        else:
+            self._buffer.remove(k)
+
+    def find(self, relation_op: str, k: Any) -> Any:
+        if relation_op not in ("==", ">", ">=", "<", "<="):
+            raise KeyError(relation_op)
+        if relation_op in (">", "<="):
+            p, q = bisect_right(self._keys, k), self._buffer._bisect_right(k)
+        else:
+            p, q = bisect_left(self._keys, k), self._buffer._bisect_left(k)
+        if relation_op in ("<", "<="):
+            found = self._last_before(p, q)
+        else:
+            found = self._first_from(p, q)
+        if found is None or (relation_op == "==" and found[0] != k):
+            raise ValueError("No item found for key %s %r" % (relation_op, k))
+        return found[1]
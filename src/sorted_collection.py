@@ -1,15 +1,47 @@
+import threading
+from array import array
 from bisect import bisect_left, bisect_right
+from collections import Counter
 from collections.abc import Collection
-from typing import Any, Callable, Iterable, Iterator, List, Sequence
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 ItemGetter = Callable[[Sequence], Any]
 
+_MISSING = object()
+
+# per-key batch size above which remove_many rebuilds instead of deleting in place
+_REBUILD_THRESHOLD = 32
+
+
+def _sort_by_key(items: Iterable, key: ItemGetter) -> Tuple[List, List]:
+    "Stable sort by key, calling key once per item; return (items, keys)"
+    items = list(items)
+    keys = list(map(key, items))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return [items[i] for i in order], [keys[i] for i in order]
+
+
+def _merge_sorted(
+    items: List, keys: Sequence, other_items: List, other_keys: Sequence
+) -> Tuple[List, List]:
+    "Merge two sorted runs; on equal keys the first run comes first"
+    keys = list(chain(keys, other_keys))
+    # timsort finds the two runs and merges them in linear time
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    items = items + other_items
+    return [items[i] for i in order], [keys[i] for i in order]
+
 
 class SortedCollection(Collection):
     def __init__(self, items: Iterable, key: ItemGetter) -> None:
         self._key = key
-        self._items = sorted(items, key=key)
-        self._keys = [key(item) for item in self._items]
+        self._load(*_sort_by_key(items, key))
+
+    def _load(self, items: List, keys: List) -> None:
+        "Replace the contents with already sorted items and their keys"
+        self._items = items
+        self._keys = keys
 
     @property
     def key(self) -> ItemGetter:
@@ -19,8 +51,7 @@ class SortedCollection(Collection):
     def key(self, key: ItemGetter) -> None:
         if key != self.key:
             self._key = key
-            self._items = sorted(self.items, key=key)
-            self._keys = [key(item) for item in self._items]
+            self._load(*_sort_by_key(self, key))
 
     @property
     def items(self) -> List:
@@ -31,14 +62,16 @@ class SortedCollection(Collection):
         return self._keys
 
     def clear(self) -> None:
-        self._key = self.key
-        self._items = []
+        self._load([], [])
 
     def copy(self) -> "SortedCollection":
         return self.__class__(self, self.key)
 
+    def _empty_like(self) -> "SortedCollection":
+        return self.__class__([], self.key)
+
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._items)
 
     def __getitem__(self, i: int) -> Any:
         return self.items[i]
@@ -56,45 +89,166 @@ class SortedCollection(Collection):
             getattr(self.key, "__name__", repr(self.key)),
         )
 
+    # Positional primitives; storage variants override these.
+
+    def _bisect_left(self, k: Any) -> int:
+        return bisect_left(self._keys, k)
+
+    def _bisect_right(self, k: Any) -> int:
+        return bisect_right(self._keys, k)
+
+    def _key_at(self, i: int) -> Any:
+        return self._keys[i]
+
+    def _item_at(self, i: int) -> Any:
+        return self._items[i]
+
+    def _insert_at(self, i: int, k: Any, item: Any) -> None:
+        self._keys.insert(i, k)
+        self._items.insert(i, item)
+
+    def _delete_at(self, i: int) -> None:
+        del self._keys[i]
+        del self._items[i]
+
+    def _iter_range(self, start: int, stop: int, reverse: bool = False) -> Iterator:
+        "Lazily iterate the items at positions start..stop-1"
+        if reverse:
+            return map(self._items.__getitem__, range(stop - 1, start - 1, -1))
+        return islice(self._items, start, stop)
+
     def __contains__(self, item: Any) -> bool:
         k = self.key(item)
-        i = bisect_left(self.keys, k)
-        j = bisect_right(self.keys, k)
-        return item in self.items[i:j]
+        i = self._bisect_left(k)
+        j = self._bisect_right(k)
+        return any(x == item for x in self._iter_range(i, j))
+
+    def _bounds(
+        self, lo: Any, hi: Any, inclusive: Tuple[bool, bool]
+    ) -> Tuple[int, int]:
+        lo_inclusive, hi_inclusive = inclusive
+        start = 0
+        if lo is not None:
+            start = self._bisect_left(lo) if lo_inclusive else self._bisect_right(lo)
+        stop = len(self)
+        if hi is not None:
+            stop = self._bisect_right(hi) if hi_inclusive else self._bisect_left(hi)
+        return start, max(start, stop)
+
+    def irange(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator:
+        """Lazily iterate items with lo <= key <= hi, without copying.
+
+        ``None`` leaves that side unbounded and ``inclusive`` makes either
+        bound strict. Mutating the collection while iterating is undefined.
+        """
+        return self._iter_range(*self._bounds(lo, hi, inclusive), reverse)
 
-    def index(self, k: int) -> int:
+    def rank(self, k: Any) -> int:
+        "Return number of items with a key < k"
+        return self._bisect_left(k)
+
+    def count_range(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> int:
+        "Return number of items irange(lo, hi, inclusive) would yield"
+        start, stop = self._bounds(lo, hi, inclusive)
+        return stop - start
+
+    def index(self, k: Any) -> int:
         "Find the position of an item.  Raise ValueError if not found."
-        i = bisect_left(self.keys, k)
-        j = bisect_right(self.keys, k)
-        return self.keys[i:j].index(k) + i
+        i = self._bisect_left(k)
+        if i != len(self) and self._key_at(i) == k:
+            return i
+        raise ValueError("%r is not in collection" % (k,))
 
-    def count(self, k: int) -> int:
+    def count(self, k: Any) -> int:
         "Return number of occurrences of item"
-        i = bisect_left(self.keys, k)
-        j = bisect_right(self.keys, k)
-        return self.keys[i:j].count(k)
+        return self._bisect_right(k) - self._bisect_left(k)
 
     def insert(self, item: Any) -> None:
         "Insert a new item.  If equal keys are found, add to the left"
         k = self.key(item)
-        i = bisect_left(self.keys, k)
-        self.keys.insert(i, k)
-        self.items.insert(i, item)
+        self._insert_at(self._bisect_left(k), k, item)
 
     def insert_right(self, item: Any) -> None:
         "Insert a new item.  If equal keys are found, add to the right"
         k = self.key(item)
-        i = bisect_right(self.keys, k)
-        self.keys.insert(i, k)
-        self.items.insert(i, item)
+        self._insert_at(self._bisect_right(k), k, item)
 
-    def remove(self, k: int) -> None:
+    def remove(self, k: Any) -> None:
         "Remove first occurence of item.  Raise ValueError if not found"
-        i = self.index(k)
-        del self.keys[i]
-        del self.items[i]
+        self._delete_at(self.index(k))
+
+    def update(self, iterable: Iterable) -> None:
+        "Insert many items with one sort and merge.  Equal keys go to the right"
+        new_items, new_keys = _sort_by_key(iterable, self.key)
+        if new_items:
+            self._load(*_merge_sorted(self.items, self.keys, new_items, new_keys))
+
+    def remove_many(self, keys: Iterable) -> None:
+        "Remove the first occurrence of each key.  Raise ValueError, removing nothing"
+        positions: List[int] = []
+        for k, n in Counter(keys).items():
+            i = self._bisect_left(k)
+            if self._bisect_right(k) - i < n:
+                raise ValueError("%r occurs fewer than %d times" % (k, n))
+            positions.extend(range(i, i + n))
+        if len(positions) < _REBUILD_THRESHOLD:
+            for i in sorted(positions, reverse=True):
+                self._delete_at(i)
+            return
+        drop = set(positions)
+        kept = [i for i in range(len(self)) if i not in drop]
+        items, keys_ = self.items, self.keys
+        self._load([items[i] for i in kept], [keys_[i] for i in kept])
+
+    def merge(self, other: "SortedCollection") -> "SortedCollection":
+        "Return a new collection holding both; on equal keys self's items come first"
+        if other.key != self.key:
+            raise ValueError("cannot merge collections with different keys")
+        result = self._empty_like()
+        result._load(*_merge_sorted(self.items, self.keys, other.items, other.keys))
+        return result
 
-    def find(self, relation_op: str, k: int) -> Any:
+    def find_many(
+        self, relation_op: str, keys: Sequence, default: Any = _MISSING
+    ) -> List:
+        """Answer ``find(relation_op, k)`` for every k in one sweep.
+
+        Results come back in query order. Missing answers raise ValueError unless
+        ``default`` is given.
+        """
+        if relation_op not in ("==", ">", ">=", "<", "<="):
+            raise KeyError(relation_op)
+        n = len(self)
+        results: List = [default] * len(keys)
+        for q, i in self._bisect_many(keys, relation_op in (">", "<=")):
+            k = keys[q]
+            position = _answer_position(relation_op, k, i, n, self._key_at)
+            if position is not None:
+                results[q] = self._item_at(position)
+            elif default is _MISSING:
+                raise ValueError("No item found for key %s %r" % (relation_op, k))
+        return results
+
+    def _bisect_many(self, keys: Sequence, right: bool) -> Iterator[Tuple[int, int]]:
+        "(query index, bisect position) per key; sorted queries resume the bisect"
+        bisect = bisect_right if right else bisect_left
+        i = 0
+        for q in sorted(range(len(keys)), key=keys.__getitem__):
+            i = bisect(self._keys, keys[q], i)
+            yield q, i
+
+    def find(self, relation_op: str, k: Any) -> Any:
         find_func_dict = {
             "==": self._find_eq,
             ">": self._find_gt,
@@ -104,37 +258,458 @@ class SortedCollection(Collection):
         }
         return find_func_dict[relation_op](k)
 
-    def _find_eq(self, k: int) -> Any:
+    def _find_eq(self, k: Any) -> Any:
         "Return first item with a key == k.  Raise ValueError if not found."
-        i = bisect_left(self.keys, k)
-        if i != len(self) and self.keys[i] == k:
-            return self.items[i]
+        i = self._bisect_left(k)
+        if i != len(self) and self._key_at(i) == k:
+            return self._item_at(i)
         raise ValueError("No item found with key equal to: %r" % (k,))
 
-    def _find_le(self, k: int) -> Any:
+    def _find_le(self, k: Any) -> Any:
         "Return last item with a key <= k.  Raise ValueError if not found."
-        i = bisect_right(self.keys, k)
+        i = self._bisect_right(k)
         if i:
-            return self._items[i - 1]
+            return self._item_at(i - 1)
         raise ValueError("No item found with key at or below: %r" % (k,))
 
-    def _find_lt(self, k: int) -> Any:
+    def _find_lt(self, k: Any) -> Any:
         "Return last item with a key < k.  Raise ValueError if not found."
-        i = bisect_left(self.keys, k)
+        i = self._bisect_left(k)
         if i:
-            return self._items[i - 1]
+            return self._item_at(i - 1)
         raise ValueError("No item found with key below: %r" % (k,))
 
-    def _find_ge(self, k: int) -> Any:
+    def _find_ge(self, k: Any) -> Any:
         "Return first item with a key >= equal to k.  Raise ValueError if not found"
-        i = bisect_left(self.keys, k)
+        i = self._bisect_left(k)
         if i != len(self):
-            return self._items[i]
+            return self._item_at(i)
         raise ValueError("No item found with key at or above: %r" % (k,))
 
-    def _find_gt(self, k: int) -> Any:
+    def _find_gt(self, k: Any) -> Any:
         "Return first item with a key > k.  Raise ValueError if not found"
-        i = bisect_right(self.keys, k)
+        i = self._bisect_right(k)
         if i != len(self):
-            return self._items[i]
+            return self._item_at(i)
         raise ValueError("No item found with key above: %r" % (k,))
+
+
+def _answer_position(
+    relation_op: str, k: Any, i: int, n: int, key_at: Callable[[int], Any]
+) -> Optional[int]:
+    """Position answering find(relation_op, k)
+
+    ``i`` is k's bisect_right for ">" and "<=", and its bisect_left otherwise.
+    """
+    if relation_op == "==":
+        return i if i < n and key_at(i) == k else None
+    if relation_op in ("<", "<="):
+        return i - 1 if i else None
+    return i if i < n else None
+
+
+class BucketedSortedCollection(SortedCollection):
+    """SortedCollection stored as a list of sorted buckets of about ``load`` items.
+
+    Inserts and removes shift one bucket instead of the whole list, and a
+    Fenwick tree over bucket lengths maps positions to buckets, so ``insert``,
+    ``remove``, ``find`` and ``__getitem__`` run in about O(log n + load).
+    ``items`` and ``keys`` build flat copies; iterate the collection instead.
+    """
+
+    def __init__(self, items: Iterable, key: ItemGetter, load: int = 1000) -> None:
+        if load < 1:
+            raise ValueError("load must be positive")
+        self._load_factor = load
+        super().__init__(items, key)
+
+    def _load(self, items: List, keys: List) -> None:
+        load = self._load_factor
+        self._item_buckets = [items[i:i + load] for i in range(0, len(items), load)]
+        self._key_buckets = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [bucket[-1] for bucket in self._key_buckets]
+        self._len = len(items)
+        self._build_index()
+
+    def copy(self) -> "BucketedSortedCollection":
+        return self.__class__(self, self.key, self._load_factor)
+
+    def _empty_like(self) -> "BucketedSortedCollection":
+        return self.__class__([], self.key, self._load_factor)
+
+    @property
+    def items(self) -> List:
+        return list(chain.from_iterable(self._item_buckets))
+
+    @property
+    def keys(self) -> List:
+        return list(chain.from_iterable(self._key_buckets))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> Any:
+        if isinstance(i, slice):
+            return self.items[i]
+        return self._item_at(i)
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._item_buckets)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(map(reversed, reversed(self._item_buckets)))
+
+    # Fenwick tree over bucket lengths
+
+    def _build_index(self) -> None:
+        tree = [len(bucket) for bucket in self._key_buckets]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._index = tree
+
+    def _index_add(self, bucket: int, delta: int) -> None:
+        tree = self._index
+        while bucket < len(tree):
+            tree[bucket] += delta
+            bucket |= bucket + 1
+
+    def _offset(self, bucket: int) -> int:
+        "Number of items stored in buckets before ``bucket``"
+        total = 0
+        while bucket > 0:
+            total += self._index[bucket - 1]
+            bucket &= bucket - 1
+        return total
+
+    def _locate(self, i: int) -> Tuple[int, int]:
+        "Map a position to (bucket, offset within bucket)"
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("%s index out of range" % self.__class__.__name__)
+        tree = self._index
+        bucket = 0
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            probe = bucket + step
+            if probe <= len(tree) and tree[probe - 1] <= i:
+                i -= tree[probe - 1]
+                bucket = probe
+            step >>= 1
+        return bucket, i
+
+    # Positional primitives
+
+    def _bisect_left(self, k: Any) -> int:
+        b = bisect_left(self._maxes, k)
+        if b == len(self._maxes):
+            return self._len
+        return self._offset(b) + bisect_left(self._key_buckets[b], k)
+
+    def _bisect_right(self, k: Any) -> int:
+        b = bisect_right(self._maxes, k)
+        if b == len(self._maxes):
+            return self._len
+        return self._offset(b) + bisect_right(self._key_buckets[b], k)
+
+    def _bisect_many(self, keys: Sequence, right: bool) -> Iterator[Tuple[int, int]]:
+        # each bisect is already O(log n) without copying the buckets
+        bisect = self._bisect_right if right else self._bisect_left
+        return enumerate(map(bisect, keys))
+
+    def _key_at(self, i: int) -> Any:
+        b, j = self._locate(i)
+        return self._key_buckets[b][j]
+
+    def _item_at(self, i: int) -> Any:
+        b, j = self._locate(i)
+        return self._item_buckets[b][j]
+
+    def _insert_into(self, b: int, j: int, k: Any, item: Any) -> None:
+        if not self._maxes:
+            self._load([item], [k])
+            return
+        keys = self._key_buckets[b]
+        keys.insert(j, k)
+        self._item_buckets[b].insert(j, item)
+        self._maxes[b] = keys[-1]
+        self._len += 1
+        if len(keys) > 2 * self._load_factor:
+            self._split(b)
+        else:
+            self._index_add(b, 1)
+
+    def _split(self, b: int) -> None:
+        half = self._load_factor
+        keys, items = self._key_buckets[b], self._item_buckets[b]
+        self._key_buckets[b + 1:b + 1] = [keys[half:]]
+        self._item_buckets[b + 1:b + 1] = [items[half:]]
+        del keys[half:]
+        del items[half:]
+        self._maxes[b:b + 1] = [keys[-1], self._key_buckets[b + 1][-1]]
+        self._build_index()
+
+    def _insert_at(self, i: int, k: Any, item: Any) -> None:
+        if i == self._len:
+            b = len(self._maxes) - 1
+            j = len(self._key_buckets[b]) if self._maxes else 0
+        else:
+            b, j = self._locate(i)
+        self._insert_into(b, j, k, item)
+
+    def _delete_at(self, i: int) -> None:
+        b, j = self._locate(i)
+        keys = self._key_buckets[b]
+        del keys[j]
+        del self._item_buckets[b][j]
+        self._len -= 1
+        if keys:
+            self._maxes[b] = keys[-1]
+            self._index_add(b, -1)
+        else:
+            del self._key_buckets[b]
+            del self._item_buckets[b]
+            del self._maxes[b]
+            self._build_index()
+
+    def _iter_range(self, start: int, stop: int, reverse: bool = False) -> Iterator:
+        if start >= stop:
+            return iter(())
+        first, lo = self._locate(start)
+        last, hi = self._locate(stop - 1)
+        return self._walk(first, lo, last, hi + 1, reverse)
+
+    def _walk(
+        self, first: int, lo: int, last: int, hi: int, reverse: bool
+    ) -> Iterator:
+        "Yield bucket[first][lo:] ... bucket[last][:hi], bucket by bucket"
+        buckets = self._item_buckets
+        order = range(last, first - 1, -1) if reverse else range(first, last + 1)
+        for b in order:
+            bucket = buckets[b]
+            start = lo if b == first else 0
+            stop = hi if b == last else len(bucket)
+            if reverse:
+                yield from map(bucket.__getitem__, range(stop - 1, start - 1, -1))
+            else:
+                yield from islice(bucket, start, stop)
+
+    def insert(self, item: Any) -> None:
+        "Insert a new item.  If equal keys are found, add to the left"
+        k = self.key(item)
+        b = min(bisect_left(self._maxes, k), len(self._maxes) - 1)
+        j = bisect_left(self._key_buckets[b], k) if self._maxes else 0
+        self._insert_into(b, j, k, item)
+
+    def insert_right(self, item: Any) -> None:
+        "Insert a new item.  If equal keys are found, add to the right"
+        k = self.key(item)
+        b = min(bisect_right(self._maxes, k), len(self._maxes) - 1)
+        j = bisect_right(self._key_buckets[b], k) if self._maxes else 0
+        self._insert_into(b, j, k, item)
+
+
+class NumericSortedCollection(SortedCollection):
+    """SortedCollection whose int or float keys live in a typed array.
+
+    Keys cost 8 bytes each instead of a boxed Python number, and sorting
+    evaluates ``key`` once per item. ``typecode`` is ``"d"`` for floats or
+    ``"q"`` for ints. By default it is ``"q"`` while every key is an int and
+    switches to ``"d"`` once a float arrives. A key that does not fit raises
+    TypeError or OverflowError; that includes ints a double cannot hold
+    exactly, such as ``2**53 + 1``.
+    """
+
+    # the base class stores keys in a list
+    _keys: "array"  # type: ignore
+
+    def __init__(
+        self, items: Iterable, key: ItemGetter, typecode: Optional[str] = None
+    ) -> None:
+        if typecode not in (None, "d", "q"):
+            raise ValueError("typecode must be 'd' or 'q', not %r" % (typecode,))
+        self._fixed_typecode = typecode
+        super().__init__(items, key)
+
+    @property
+    def typecode(self) -> str:
+        return self._keys.typecode
+
+    def _load(self, items: List, keys: Sequence) -> None:
+        typecode = self._fixed_typecode
+        if typecode is None:
+            if isinstance(keys, array):
+                typecode = keys.typecode
+            else:
+                typecode = "q" if all(isinstance(k, int) for k in keys) else "d"
+        self._items = items
+        self._keys = _typed_keys(typecode, keys)
+
+    def _insert_at(self, i: int, k: Any, item: Any) -> None:
+        if self._keys.typecode == "d":
+            if isinstance(k, int) and float(k) != k:
+                raise OverflowError("%r cannot be stored exactly as a double" % (k,))
+        elif self._fixed_typecode is None and not isinstance(k, int):
+            self._keys = _typed_keys("d", self._keys)
+        super()._insert_at(i, k, item)
+
+    def copy(self) -> "NumericSortedCollection":
+        result = self._empty_like()
+        result._load(list(self._items), self._keys)
+        return result
+
+    def _empty_like(self) -> "NumericSortedCollection":
+        return self.__class__([], self.key, self._fixed_typecode)
+
+
+def _typed_keys(typecode: str, keys: Sequence) -> array:
+    "array(typecode, keys), raising OverflowError for ints a double would round"
+    converted = array(typecode, keys)
+    if typecode == "d" and converted.tolist() != list(keys):
+        for k, stored in zip(keys, converted):
+            if isinstance(k, int) and stored != k:
+                raise OverflowError("%r cannot be stored exactly as a double" % (k,))
+    return converted
+
+
+class _SnapshotBuckets(BucketedSortedCollection):
+    "BucketedSortedCollection whose copies share buckets until they are written"
+
+    def cow_copy(self) -> "_SnapshotBuckets":
+        "O(n / load) copy sharing every bucket; a bucket is copied when changed"
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._item_buckets = list(self._item_buckets)
+        new._key_buckets = list(self._key_buckets)
+        new._maxes = list(self._maxes)
+        new._index = list(self._index)
+        return new
+
+    def _own(self, b: int) -> None:
+        self._key_buckets[b] = list(self._key_buckets[b])
+        self._item_buckets[b] = list(self._item_buckets[b])
+
+    def _insert_into(self, b: int, j: int, k: Any, item: Any) -> None:
+        if self._maxes:
+            self._own(b)
+        super()._insert_into(b, j, k, item)
+
+    def _delete_at(self, i: int) -> None:
+        self._own(self._locate(i)[0])
+        super()._delete_at(i)
+
+
+class ConcurrentSortedCollection(Collection):
+    """SortedCollection shared between threads, with lock-free readers.
+
+    The contents are an immutable bucketed snapshot. Readers take the current
+    one with a single attribute read, so they never block and always see keys
+    and items that belong together; iterating keeps going over the snapshot
+    it started with. Writers serialize on a lock, copy the bucket list and the
+    buckets they touch, and publish the new snapshot by assignment.
+    """
+
+    def __init__(self, items: Iterable, key: ItemGetter, load: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._snapshot = _SnapshotBuckets(items, key, load)
+
+    def snapshot(self) -> BucketedSortedCollection:
+        "The current contents.  Treat it as read-only"
+        return self._snapshot
+
+    def _write(self, operation: Callable[[_SnapshotBuckets], Any]) -> Any:
+        with self._lock:
+            snapshot = self._snapshot.cow_copy()
+            result = operation(snapshot)
+            self._snapshot = snapshot
+            return result
+
+    @property
+    def key(self) -> ItemGetter:
+        return self._snapshot.key
+
+    @property
+    def items(self) -> List:
+        return self._snapshot.items
+
+    @property
+    def keys(self) -> List:
+        return self._snapshot.keys
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __getitem__(self, i: int) -> Any:
+        return self._snapshot[i]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._snapshot)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._snapshot)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._snapshot
+
+    def __repr__(self) -> str:
+        return "%s(%r, key=%s)" % (
+            self.__class__.__name__,
+            self.items,
+            getattr(self.key, "__name__", repr(self.key)),
+        )
+
+    def index(self, k: Any) -> int:
+        return self._snapshot.index(k)
+
+    def count(self, k: Any) -> int:
+        return self._snapshot.count(k)
+
+    def rank(self, k: Any) -> int:
+        return self._snapshot.rank(k)
+
+    def count_range(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> int:
+        return self._snapshot.count_range(lo, hi, inclusive)
+
+    def irange(
+        self,
+        lo: Any = None,
+        hi: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator:
+        return self._snapshot.irange(lo, hi, inclusive, reverse)
+
+    def find(self, relation_op: str, k: Any) -> Any:
+        return self._snapshot.find(relation_op, k)
+
+    def find_many(
+        self, relation_op: str, keys: Sequence, default: Any = _MISSING
+    ) -> List:
+        return self._snapshot.find_many(relation_op, keys, default)
+
+    def insert(self, item: Any) -> None:
+        self._write(lambda snapshot: snapshot.insert(item))
+
+    def insert_right(self, item: Any) -> None:
+        self._write(lambda snapshot: snapshot.insert_right(item))
+
+    def remove(self, k: Any) -> None:
+        self._write(lambda snapshot: snapshot.remove(k))
+
+    def update(self, iterable: Iterable) -> None:
+        items = list(iterable)
+        self._write(lambda snapshot: snapshot.update(items))
+
+    def remove_many(self, keys: Iterable) -> None:
+        keys = list(keys)
+        self._write(lambda snapshot: snapshot.remove_many(keys))
+
+    def clear(self) -> None:
+        self._write(lambda snapshot: snapshot.clear())
@@ -1,4 +1,7 @@
-from typing import Sequence, Type, Union
+from collections import deque
+from itertools import accumulate, islice
+from operator import ge, le
+from typing import Callable, Dict, Hashable, List, Sequence, Union
 
 Number = Union[int, float]
 
@@ -43,30 +46,123 @@ class TwoPointer(object):
         pass
 
 
-def solve_abc032_c(s: Sequence[Number], k: int) -> int:
-    class ABC032CSolver(TwoPointer):
-        def __init__(self, array: Sequence[Number], k: int):
-            super().__init__(array, initial_memo=1)
-            self.k = k
+def solve_abc032_c(s: Sequence[int], k: int) -> int:
+    """積がk以下となる連続部分列の最大の長さ (ABC032 C)"""
+    return longest_window_product_at_most(s, k)
 
-        def objective(self, memo: Number, left: int, right: int) -> Number:
-            """最小化する目的関数"""
-            return -(right - left)  # 最小化なので、-をつける
 
-        def condition(self, memo: Number, left: int, right: int) -> bool:
-            """満たすべき条件"""
-            return memo < self.k
+def _check_width(width: int) -> None:
+    if width < 1:
+        raise ValueError("width must be positive")
 
-        def renew(self, memo: Number, left: int, right: int) -> Number:
-            """rightが移動した際のmemoの更新"""
-            return memo * self.array[right]
 
-        def reset(self, memo: Number, left: int, right: int) -> Number:
-            """leftが移動した際のmemoのリセット"""
-            return memo // self.array[left]
+def window_sums(array: Sequence[Number], width: int) -> List[Number]:
+    """幅widthの各区間の和. 累積和の差で求める"""
+    _check_width(width)
+    prefix = [0] + list(accumulate(array))
+    return [b - a for a, b in zip(prefix, islice(prefix, width, None))]
 
-    if 0 in s:
-        return len(s)
-    if min(s) > k:
+
+def longest_window_sum_at_most(array: Sequence[Number], limit: Number) -> int:
+    """和がlimit以下となる連続部分列の最大の長さ
+
+    arrayの要素は非負とする. 右端を1つ進めるごとに、和がlimitを超える間だけ左端を進める.
+    """
+    best = 0
+    total: Number = 0
+    left = 0
+    for right, value in enumerate(array):
+        total += value
+        while total > limit and left <= right:
+            total -= array[left]
+            left += 1
+        if right + 1 - left > best:
+            best = right + 1 - left
+    return best
+
+
+def longest_window_product_at_most(array: Sequence[int], limit: Number) -> int:
+    """積がlimit以下となる連続部分列の最大の長さ
+
+    arrayの要素は非負の整数とする. 0を含むなら全体が解となる.
+    """
+    if limit < 0:
         return 0
-    return -ABC032CSolver(s, k).search()
\ No newline at end of file
+    if 0 in array:
+        return len(array)
+    best = 0
+    product = 1
+    left = 0
+    for right, value in enumerate(array):
+        product *= value
+        while left <= right and product > limit:
+            product //= array[left]
+            left += 1
+        if right + 1 - left > best:
+            best = right + 1 - left
+    return best
+
+
+def window_distinct_counts(array: Sequence[Hashable], width: int) -> List[int]:
+    """幅widthの各区間に含まれる異なる値の個数"""
+    _check_width(width)
+    counts: Dict[Hashable, int] = {}
+    result = []
+    for right, value in enumerate(array):
+        counts[value] = counts.get(value, 0) + 1
+        if right >= width:
+            old = array[right - width]
+            if counts[old] == 1:
+                del counts[old]
+            else:
+                counts[old] -= 1
+        if right >= width - 1:
+            result.append(len(counts))
+    return result
+
+
+def longest_window_distinct_at_most(array: Sequence[Hashable], k: int) -> int:
+    """異なる値がk個以下となる連続部分列の最大の長さ"""
+    counts: Dict[Hashable, int] = {}
+    best = 0
+    left = 0
+    for right, value in enumerate(array):
+        counts[value] = counts.get(value, 0) + 1
+        while len(counts) > k:
+            old = array[left]
+            if counts[old] == 1:
+                del counts[old]
+            else:
+                counts[old] -= 1
+            left += 1
+        if right + 1 - left > best:
+            best = right + 1 - left
+    return best
+
+
+def _window_extremes(
+    array: Sequence[Number], width: int, dominates: Callable[[Number, Number], bool]
+) -> List[Number]:
+    # 区間内で後ろの値にdominatesされない値のindexだけを単調に並べておく
+    _check_width(width)
+    candidates: deque = deque()
+    result = []
+    for right, value in enumerate(array):
+        while candidates and dominates(value, array[candidates[-1]]):
+            candidates.pop()
+        candidates.append(right)
+        if candidates[0] <= right - width:
+            candidates.popleft()
+        if right >= width - 1:
+            result.append(array[candidates[0]])
+    return result
+
+
+def window_minimums(array: Sequence[Number], width: int) -> List[Number]:
+    """幅widthの各区間の最小値. 単調なdequeで全体O(n)"""
+    return _window_extremes(array, width, le)
+
+
+def window_maximums(array: Sequence[Number], width: int) -> List[Number]:
+    """幅widthの各区間の最大値. 単調なdequeで全体O(n)"""
+    return _window_extremes(array, width, ge)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from random import Random
+
+from src.graph import apsp, base, bfs, dijkstra
+
+
+class TestAllPairsShortestPaths(unittest.TestCase):
+    def setUp(self):
+        """
+        0 ---> 1
+        |   /  | ^
+        |  /   |  2
+        v v    v v
+        4 <---  3
+        """
+        self.graph = base.AdjacentMatrixGraph(5)
+        edges = [(0, 1, 1), (0, 4, 4), (1, 3, 2), (1, 4, 3), (2, 1, 1), (2, 3, 1)]
+        for from_, to, weight in edges + [(3, 4, 1)]:
+            self.graph.add_edge(from_, to, weight)
+
+    def test_floyd_warshall(self):
+        dist = apsp.floyd_warshall(self.graph)
+        self.assertEqual(dist[0, 4], 4)
+        self.assertEqual(dist[2, 4], 2)
+        self.assertEqual(dist[4, 0], apsp.INF)
+        for from_ in range(self.graph.size):
+            self.assertEqual(
+                dist.to_lists()[from_], dijkstra.dijkstra(self.graph, from_)[0]
+            )
+
+    def test_floyd_warshall_random(self):
+        random = Random(0)
+        graph = base.AdjacentMatrixGraph(20)
+        for _ in range(60):
+            from_, to = random.randrange(20), random.randrange(20)
+            graph.add_edge(from_, to, random.randint(1, 9))
+        dist = apsp.all_pairs_shortest_paths(graph).to_lists()
+        for from_ in range(graph.size):
+            self.assertEqual(dist[from_], dijkstra.dijkstra(graph, from_)[0])
+
+    def test_negative_cycle(self):
+        graph = base.AdjacentMatrixGraph(2)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 0, -2)
+        with self.assertRaises(ValueError):
+            apsp.floyd_warshall(graph)
+
+    def test_bfs_all_pairs(self):
+        graph = base.AdjacentMatrixGraph(4)
+        for from_, to in [(0, 1), (1, 2), (2, 3), (3, 1)]:
+            graph.add_edge(from_, to, 1)
+        self.assertTrue(apsp.has_uniform_weights(graph))
+        self.assertFalse(apsp.has_uniform_weights(self.graph))
+        dist = apsp.all_pairs_shortest_paths(graph)
+        self.assertEqual(
+            dist.to_lists(), [bfs.distances_from(graph, i) for i in range(4)]
+        )
+        self.assertEqual(dist.to_lists(), apsp.floyd_warshall(graph).to_lists())
+
+    def test_negative_uniform_weight(self):
+        graph = base.AdjacentMatrixGraph(3)
+        for from_, to in [(0, 1), (1, 2), (0, 2)]:
+            graph.add_edge(from_, to, -1)
+        self.assertTrue(apsp.has_uniform_weights(graph))
+        dist = apsp.all_pairs_shortest_paths(graph)
+        self.assertEqual(dist.to_lists()[0], [0, -1, -2])
+
+    def test_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dist.bin")
+            dist = apsp.floyd_warshall(self.graph, path)
+            expected = apsp.floyd_warshall(self.graph).to_lists()
+            self.assertEqual(dist.to_lists(), expected)
+            dist.flush()
+            self.assertEqual(os.path.getsize(path), 5 * 5 * 8)
+            dist.close()
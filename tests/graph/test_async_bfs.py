@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+from random import Random
+
+from src.graph import async_bfs, base, bfs
+
+
+class TestAsyncBFS(unittest.TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.graph = base.AdjacentListGraph([base.Vertex() for _ in range(50)])
+        for _ in range(150):
+            from_, to = random.randrange(50), random.randrange(50)
+            self.graph.add_edge(from_, to, random.randint(1, 3))
+
+    def test_distances_from(self):
+        for from_ in (0, 7, 31):
+            store = async_bfs.InMemoryStore.from_graph(self.graph)
+            graph = async_bfs.KeyValueGraph(store, self.graph.size, batch_size=4)
+            distances = asyncio.run(async_bfs.distances_from(graph, from_))
+            self.assertEqual(bfs.distances_from(self.graph, from_), distances)
+
+    def test_round_trips_per_level(self):
+        store = async_bfs.InMemoryStore.from_graph(self.graph, latency=0.001)
+        graph = async_bfs.KeyValueGraph(store, self.graph.size)
+        asyncio.run(async_bfs.distances_from(graph, 0))
+        levels = len(list(bfs.iter_levels(self.graph, 0)))
+        self.assertEqual(levels, store.round_trips)
+
+    def test_max_depth(self):
+        store = async_bfs.InMemoryStore.from_graph(self.graph)
+        graph = async_bfs.KeyValueGraph(store, self.graph.size)
+        distances = asyncio.run(async_bfs.distances_from(graph, 0, max_depth=1))
+        reached = {node for node, d in enumerate(distances) if d is not None}
+        self.assertEqual({0} | set(self.graph.neighbors(0)), reached)
+        self.assertEqual(1, store.round_trips)
+
+    def test_single_lookup(self):
+        store = async_bfs.InMemoryStore({0: [(1, None)]})
+        graph = async_bfs.KeyValueGraph(store, 2)
+        self.assertEqual([(1, None)], asyncio.run(graph.weighted_neighbors(0)))
+        self.assertEqual([], asyncio.run(graph.weighted_neighbors(1)))
+        with self.assertRaises(ValueError):
+            async_bfs.KeyValueGraph(store, 2, batch_size=0)
+
+    def test_concurrency_across_event_loops(self):
+        in_flight = []
+
+        class CountingStore(async_bfs.InMemoryStore):
+            active = 0
+
+            async def get_many(self, keys):
+                self.active += 1
+                in_flight.append(self.active)
+                try:
+                    return await super().get_many(keys)
+                finally:
+                    self.active -= 1
+
+        store = CountingStore.from_graph(self.graph, latency=0.001)
+        graph = async_bfs.KeyValueGraph(
+            store, self.graph.size, batch_size=1, concurrency=2
+        )
+        for from_ in (0, 7):
+            distances = asyncio.run(async_bfs.distances_from(graph, from_))
+            self.assertEqual(bfs.distances_from(self.graph, from_), distances)
+        self.assertEqual(2, max(in_flight))
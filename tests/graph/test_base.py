@@ -25,8 +25,11 @@ class TestAdjacentListGraph(unittest.TestCase):
         self.list_graph = self.prepare_graph(
             base.AdjacentListGraph([base.Vertex() for _ in range(5)])
         )
+        self.indexed_graph = self.prepare_graph(
+            base.AdjacentListGraph([base.Vertex() for _ in range(5)], indexed=True)
+        )
         self.matrix_graph = self.prepare_graph(base.AdjacentMatrixGraph(5))
-        self.graphs = (self.list_graph, self.matrix_graph)
+        self.graphs = (self.list_graph, self.indexed_graph, self.matrix_graph)
 
     def test_edges_from(self):
         test_cases = [(0, [1, 4]), (1, [3, 4]), (2, [1, 3]), (3, [4]), (4, [])]
@@ -82,3 +85,85 @@ class TestAdjacentListGraph(unittest.TestCase):
             for from_, to_edges in test_cases:
                 for expected, actual in zip(to_edges, graph.edges_from(from_)):
                     self.assertEqual(expected, actual.to)
+
+    def test_sources_to(self):
+        test_cases = [(0, []), (1, [0, 2]), (2, []), (3, [1, 2]), (4, [0, 1, 3])]
+        for graph in self.graphs:
+            for to, sources in test_cases:
+                self.assertEqual(sources, graph.sources_to(to))
+                self.assertEqual(sources, base.Graph.sources_to(graph, to))
+                weighted = [(from_, graph.get_weight(from_, to)) for from_ in sources]
+                self.assertEqual(weighted, list(graph.weighted_sources_to(to)))
+                self.assertEqual(weighted, base.Graph.weighted_sources_to(graph, to))
+            graph.remove_edge(2, 1)
+            graph.add_edge(4, 1, 1)
+            self.assertEqual([0, 4], graph.sources_to(1))
+            self.assertEqual([(0, 1), (4, 1)], list(graph.weighted_sources_to(1)))
+
+    def test_degree(self):
+        for graph in self.graphs:
+            self.assertEqual([2, 2, 2, 1, 0], [graph.degree(i) for i in range(5)])
+            self.assertEqual(2, base.Graph.degree(graph, 0))
+            graph.remove_edge(0, 1)
+            self.assertEqual(1, graph.degree(0))
+
+    def test_uniform_weight(self):
+        for graph in self.graphs:
+            self.assertEqual((False, None), graph.uniform_weight())
+        graph = base.AdjacentListGraph([base.Vertex() for _ in range(3)])
+        self.assertEqual((True, None), graph.uniform_weight())
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 2, 0)
+        self.assertEqual((True, 0), graph.uniform_weight())
+        graph.add_edge(2, 0, -1)
+        self.assertEqual((False, None), graph.uniform_weight())
+
+    def test_sources_to_prebuilt_vertices(self):
+        vertices = [base.Vertex() for _ in range(3)]
+        vertices[0].add_edge(2)
+        vertices[1].add_edge(2)
+        graph = base.AdjacentListGraph(vertices)
+        vertices[2].add_edge(0)
+        self.assertEqual([0, 1], graph.sources_to(2))
+        self.assertEqual([2], graph.sources_to(0))
+        graph.add_edge(2, 1)
+        graph.remove_edge(0, 2)
+        self.assertEqual([1], graph.sources_to(2))
+        self.assertEqual([2], graph.sources_to(1))
+
+    def test_neighbors(self):
+        test_cases = [(0, [1, 4], [1, 4]), (1, [3, 4], [2, 3]), (4, [], [])]
+        for graph in self.graphs:
+            for from_, targets, weights in test_cases:
+                self.assertEqual(targets, list(graph.neighbors(from_)))
+                self.assertEqual(
+                    list(zip(targets, weights)), list(graph.weighted_neighbors(from_))
+                )
+                self.assertEqual(targets, base.Graph.neighbors(graph, from_))
+            graph.remove_edge(0, 1)
+            graph.add_edge(0, 2, 7)
+            self.assertEqual([(2, 7), (4, 4)], sorted(graph.weighted_neighbors(0)))
+
+
+class TestVertex(unittest.TestCase):
+    def test_index_consistency(self):
+        for vertex in (base.Vertex(), base.Vertex(indexed=True)):
+            self.assertTrue(vertex.add_edge(3, 1))
+            self.assertTrue(vertex.add_edge(1, 2))
+            self.assertTrue(vertex.add_edge(2, 3))
+            self.assertFalse(vertex.add_edge(1, 9))
+            self.assertTrue(vertex.remove_edge(1))
+            self.assertFalse(vertex.remove_edge(1))
+            self.assertTrue(vertex.add_edge(1, 4))
+            self.assertEqual([3, 2, 1], [edge.to for edge in vertex.edges])
+            self.assertEqual(4, vertex.get_edge(1).weight)
+            self.assertIsNone(vertex.get_edge(5))
+            if vertex.index is not None:
+                self.assertEqual({3, 2, 1}, set(vertex.index))
+
+    def test_build_index(self):
+        vertex = base.Vertex()
+        vertex.add_edge(0, 1)
+        vertex.build_index()
+        self.assertIs(vertex.edges[0], vertex.get_edge(0))
+        self.assertFalse(vertex.add_edge(0))
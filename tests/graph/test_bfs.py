@@ -1,4 +1,5 @@
 import unittest
+from random import Random
 
 from src.graph import base, bfs
 
@@ -37,3 +38,116 @@ class TestDFS(unittest.TestCase):
         path = [1, 3, 5, 9, 0]
         for graph in self.graphs:
             self.assertEqual(path, bfs.shortest_path(graph, 1, 0))
+
+    def test_shortest_path_bidirectional(self):
+        for graph in self.graphs:
+            self.assertEqual([1, 3, 5, 9, 0], bfs.shortest_path(graph, 1, 0, True))
+            self.assertEqual([3], bfs.shortest_path(graph, 3, 3, True))
+            self.assertEqual([], bfs.shortest_path(graph, 0, 1, True))
+
+    def test_shortest_path_bidirectional_random(self):
+        random = Random(0)
+        for _ in range(20):
+            graph = base.AdjacentListGraph([base.Vertex() for _ in range(30)])
+            for _ in range(60):
+                graph.add_edge(random.randrange(30), random.randrange(30), 1)
+            for _ in range(5):
+                from_, to = random.randrange(30), random.randrange(30)
+                expected = bfs.shortest_path(graph, from_, to)
+                actual = bfs.shortest_path(graph, from_, to, bidirectional=True)
+                self.assertEqual(len(expected), len(actual))
+                if actual:
+                    self.assertEqual((from_, to), (actual[0], actual[-1]))
+                for a, b in zip(actual, actual[1:]):
+                    self.assertTrue(graph.is_adjacent(a, b))
+
+    def test_direction_optimizing_distances_from(self):
+        for graph in self.graphs:
+            for alpha in (0.0, 14.0, 1e9):
+                self.assertEqual(
+                    bfs.distances_from(graph, 1),
+                    bfs.direction_optimizing_distances_from(graph, 1, alpha=alpha),
+                )
+
+    def test_direction_optimizing_distances_from_random(self):
+        random = Random(1)
+        for _ in range(20):
+            graph = base.AdjacentListGraph([base.Vertex() for _ in range(50)])
+            for _ in range(300):
+                graph.add_edge(random.randrange(50), random.randrange(50), 2)
+            from_ = random.randrange(50)
+            self.assertEqual(
+                bfs.distances_from(graph, from_),
+                bfs.direction_optimizing_distances_from(graph, from_, beta=4.0),
+            )
+
+    def test_direction_optimizing_distances_from_weighted(self):
+        random = Random(3)
+        for _ in range(20):
+            graph = base.AdjacentListGraph([base.Vertex() for _ in range(50)])
+            for _ in range(300):
+                graph.add_edge(
+                    random.randrange(50), random.randrange(50), random.randint(1, 5)
+                )
+            from_ = random.randrange(50)
+            self.assertEqual(
+                bfs.distances_from(graph, from_),
+                bfs.direction_optimizing_distances_from(graph, from_, alpha=1e9),
+            )
+
+    def test_direction_optimizing_break_if(self):
+        graph = base.AdjacentListGraph([base.Vertex() for _ in range(5)])
+        for from_, to in [(0, 1), (0, 2), (1, 3), (2, 4)]:
+            graph.add_edge(from_, to, 1)
+        for alpha in (0.0, 1e9):
+            self.assertEqual(
+                [0, 1, 1, 2, None],
+                bfs.direction_optimizing_distances_from(
+                    graph, 0, break_if=lambda node: node == 2, alpha=alpha
+                ),
+            )
+        for graph in self.graphs:
+            for stop in range(graph.size):
+                for alpha in (0.0, 14.0, 1e9):
+                    self.assertEqual(
+                        bfs.distances_from(graph, 1, lambda node: node == stop),
+                        bfs.direction_optimizing_distances_from(
+                            graph, 1, lambda node: node == stop, alpha=alpha
+                        ),
+                    )
+
+    def test_direction_optimizing_break_if_random(self):
+        random = Random(2)
+        for _ in range(20):
+            graph = base.AdjacentListGraph([base.Vertex() for _ in range(40)])
+            for _ in range(120):
+                graph.add_edge(random.randrange(40), random.randrange(40), 1)
+            from_, stop = random.randrange(40), random.randrange(40)
+            for alpha, beta in ((1e9, 4.0), (1e9, 1e9), (2.0, 24.0)):
+                self.assertEqual(
+                    bfs.distances_from(graph, from_, lambda node: node == stop),
+                    bfs.direction_optimizing_distances_from(
+                        graph, from_, lambda node: node == stop, alpha, beta
+                    ),
+                )
+
+    def test_iter_levels(self):
+        levels = [[1], [3, 8], [4, 5, 6], [2, 7, 9], [0]]
+        for graph in self.graphs:
+            for sparse in (False, True):
+                actual = list(bfs.iter_levels(graph, 1, sparse=sparse))
+                self.assertEqual(levels, [sorted(level) for level in actual])
+                actual = list(bfs.iter_levels(graph, 1, 2, sparse=sparse))
+                self.assertEqual(levels[:3], [sorted(level) for level in actual])
+            self.assertEqual([[0]], list(bfs.iter_levels(graph, 0)))
+            self.assertEqual([[1]], list(bfs.iter_levels(graph, 1, max_depth=0)))
+
+    def test_iter_distances(self):
+        for graph in self.graphs:
+            pairs = list(bfs.iter_distances(graph, 1, sparse=True))
+            self.assertEqual(
+                dict(pairs), dict(enumerate(bfs.distances_from(graph, 1)))
+            )
+            self.assertEqual(
+                [(1, 0), (3, 1), (8, 1)], sorted(bfs.iter_distances(graph, 1, 1))
+            )
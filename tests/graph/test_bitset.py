@@ -0,0 +1,100 @@
+import unittest
+from random import Random
+
+from src.graph import base, bfs, bitset
+
+
+class TestBitsetMatrixGraph(unittest.TestCase):
+    def setUp(self):
+        """
+        0 ---> 1
+        |   /  | ^
+        |  /   |  2
+        v v    v v
+        4 <---  3
+        """
+        self.graph = bitset.BitsetMatrixGraph(5)
+        edges = [(0, 1, 1), (0, 4, 4), (1, 3, 2), (1, 4, 3), (2, 1, 1), (2, 3, 1)]
+        for from_, to, weight in edges + [(3, 4, 1)]:
+            self.graph.add_edge(from_, to, weight)
+
+    def test_iter_bits(self):
+        self.assertEqual(list(bitset.iter_bits(0b101001)), [0, 3, 5])
+        self.assertEqual(list(bitset.iter_bits(0)), [])
+
+    def test_graph_methods(self):
+        self.assertEqual(self.graph.rows[0], 0b10010)
+        self.assertEqual(list(self.graph.neighbors(1)), [3, 4])
+        self.assertEqual(
+            [(e.to, e.weight) for e in self.graph.edges_from(0)], [(1, 1), (4, 4)]
+        )
+        self.assertEqual(self.graph.sources_to(4), [0, 1, 3])
+        self.assertEqual(self.graph.get_weight(1, 4), 3)
+        self.assertEqual(
+            list(self.graph.weighted_sources_to(4)),
+            [(from_, self.graph.get_weight(from_, 4)) for from_ in (0, 1, 3)],
+        )
+        self.assertEqual(self.graph.degree(1), 2)
+        self.assertIsNone(self.graph.get_weight(4, 1))
+        self.assertFalse(self.graph.add_edge(0, 1, 9))
+        self.assertTrue(self.graph.remove_edge(0, 1))
+        self.assertFalse(self.graph.remove_edge(0, 1))
+        self.assertFalse(self.graph.remove_edge(0, 7))
+        self.assertFalse(self.graph.is_adjacent(0, 1))
+        self.assertEqual(self.graph.sources_to(1), [2])
+        self.assertTrue(self.graph.add_edge(4, 0, 0.5))
+        self.assertEqual(self.graph.get_weight(4, 0), 0.5)
+
+    def test_unweighted(self):
+        graph = bitset.BitsetMatrixGraph(3)
+        graph.add_edge(0, 1)
+        self.assertIsNone(graph.weights)
+        self.assertIsNone(graph.get_weight(0, 1))
+        self.assertEqual(graph.uniform_weight(), (True, None))
+        self.assertEqual(bitset.distances_from(graph, 0), bfs.distances_from(graph, 0))
+
+    def test_uniform_weight_tracks_edges(self):
+        graph = bitset.BitsetMatrixGraph(3)
+        self.assertEqual(graph.uniform_weight(), (True, None))
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 2, 0)
+        self.assertEqual(graph.uniform_weight(), (True, 0))
+        graph.add_edge(2, 0, 2)
+        self.assertEqual(graph.uniform_weight(), (False, None))
+        graph.remove_edge(0, 1)
+        graph.remove_edge(1, 2)
+        self.assertEqual(graph.uniform_weight(), (True, 2))
+        graph.add_edge(0, 2, 2.0)
+        self.assertEqual(graph.uniform_weight(), (True, 2.0))
+        graph.remove_edge(2, 0)
+        graph.remove_edge(0, 2)
+        self.assertEqual(graph.uniform_weight(), (True, None))
+
+    def test_distances_from(self):
+        self.assertEqual(bitset.levels_from(self.graph, 2), [None, 1, 0, 1, 2])
+        self.assertEqual(self.graph.uniform_weight(), (False, None))
+        for from_, to in [(0, 4), (1, 3), (1, 4)]:
+            self.graph.remove_edge(from_, to)
+        self.assertEqual(self.graph.uniform_weight(), (True, 1))
+        self.assertEqual(
+            bitset.distances_from(self.graph, 0), bfs.distances_from(self.graph, 0)
+        )
+        self.assertEqual(
+            bitset.distances_from(self.graph, 0), bfs.distances_from(self.graph, 0)
+        )
+
+    def test_distances_from_random(self):
+        random = Random(0)
+        for _ in range(10):
+            list_graph = base.AdjacentListGraph([base.Vertex() for _ in range(40)])
+            for _ in range(100):
+                list_graph.add_edge(random.randrange(40), random.randrange(40), 1)
+            graph = bitset.BitsetMatrixGraph.from_graph(list_graph)
+            for from_ in range(0, 40, 7):
+                expected = bfs.distances_from(list_graph, from_)
+                self.assertEqual(expected, bitset.distances_from(graph, from_))
+                self.assertEqual(expected, bfs.distances_from(graph, from_))
+                self.assertEqual(
+                    len(bfs.shortest_path(list_graph, from_, 0)),
+                    len(bfs.shortest_path(graph, from_, 0)),
+                )
@@ -0,0 +1,63 @@
+import unittest
+
+from src.graph import base, bfs, cache
+
+
+class TestShortestPathCache(unittest.TestCase):
+    def setUp(self):
+        """
+        0 ---> 1
+        |   /  | ^
+        |  /   |  2
+        v v    v v
+        4 <---  3
+        """
+        self.graphs = (
+            base.AdjacentListGraph([base.Vertex() for _ in range(5)]),
+            base.AdjacentMatrixGraph(5),
+        )
+        edges = [(0, 1, 1), (0, 4, 4), (1, 3, 2), (1, 4, 3), (2, 1, 1), (2, 3, 1)]
+        for graph in self.graphs:
+            for from_, to, weight in edges + [(3, 4, 1)]:
+                graph.add_edge(from_, to, weight)
+
+    def test_answers_match_bfs(self):
+        for graph in self.graphs:
+            paths = cache.ShortestPathCache(graph)
+            for from_ in range(graph.size):
+                self.assertEqual(
+                    bfs.distances_from(graph, from_), paths.distances_from(from_)
+                )
+                for to in range(graph.size):
+                    self.assertEqual(
+                        bfs.shortest_path(graph, from_, to),
+                        paths.shortest_path(from_, to),
+                    )
+
+    def test_version(self):
+        for graph in self.graphs:
+            version = graph.version
+            self.assertTrue(graph.add_edge(4, 0, 1))
+            self.assertFalse(graph.add_edge(4, 0, 1))
+            self.assertTrue(graph.remove_edge(0, 1))
+            self.assertFalse(graph.remove_edge(0, 1))
+            self.assertEqual(version + 2, graph.version)
+
+    def test_invalidation_and_stats(self):
+        for graph in self.graphs:
+            paths = cache.ShortestPathCache(graph, maxsize=2)
+            self.assertEqual([], paths.shortest_path(0, 2))
+            paths.distances_from(0)
+            paths.distances_from(1)
+            paths.distances_from(2)
+            self.assertEqual((1, 3, 1, 0, 2, 2), tuple(paths.cache_info()))
+            graph.add_edge(4, 2, 1)
+            self.assertEqual([0, 4, 2], paths.shortest_path(0, 2))
+            self.assertEqual((1, 4, 1, 2, 2, 1), tuple(paths.cache_info()))
+            paths.cache_clear()
+            self.assertEqual((0, 0, 0, 0, 2, 0), tuple(paths.cache_info()))
+
+    def test_returned_distances_are_copies(self):
+        paths = cache.ShortestPathCache(self.graphs[0])
+        paths.distances_from(0)[1] = 100
+        self.assertEqual(1, paths.distances_from(0)[1])
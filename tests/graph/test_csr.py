@@ -0,0 +1,142 @@
+import unittest
+
+from src.graph import base, bfs, csr
+
+
+class TestCSRGraph(unittest.TestCase):
+    edges = [
+        (0, 1, 1), (0, 4, 4), (1, 3, 2), (1, 4, 3), (2, 1, 1), (2, 3, 1), (3, 4, 1)
+    ]
+
+    def setUp(self):
+        """
+        0 ---> 1
+        |   /  | ^
+        |  /   |  2
+        v v    v v
+        4 <---  3
+        """
+        self.graph = csr.CSRGraph.from_edges(5, self.edges)
+
+    def test_from_edges(self):
+        self.assertEqual(list(self.graph.offsets), [0, 2, 4, 6, 7, 7])
+        self.assertEqual(list(self.graph.targets), [1, 4, 3, 4, 1, 3, 4])
+        self.assertEqual(list(self.graph.weights), [1, 4, 2, 3, 1, 1, 1])
+        self.assertEqual(self.graph.edge_count, 7)
+
+    def test_from_edges_keeps_order_and_first_duplicate(self):
+        graph = csr.CSRGraph.from_edges(3, [(1, 2, 5), (0, 2, 1), (1, 0, 2), (1, 2, 9)])
+        self.assertEqual([e.to for e in graph.edges_from(1)], [2, 0])
+        self.assertEqual(graph.get_weight(1, 2), 5)
+
+    def test_from_edges_unweighted(self):
+        graph = csr.CSRGraph.from_edges(3, [(0, 1, None), (1, 2, None)])
+        self.assertIsNone(graph.weights)
+        self.assertIsNone(graph.get_weight(0, 1))
+
+    def test_from_edges_out_of_range(self):
+        with self.assertRaises(IndexError):
+            csr.CSRGraph.from_edges(2, [(0, 2, None)])
+
+    def test_get_weight_and_is_adjacent(self):
+        test_cases = [(0, 1, 1), (0, 4, 4), (2, 3, 1), (1, 2, None), (2, 0, None)]
+        for from_, to, weight in test_cases:
+            self.assertEqual(weight, self.graph.get_weight(from_, to))
+            self.assertEqual(weight is not None, self.graph.is_adjacent(from_, to))
+
+    def test_add_and_remove_edge(self):
+        self.assertTrue(self.graph.add_edge(4, 0, 2.5))
+        self.assertFalse(self.graph.add_edge(4, 0, 1))
+        self.assertEqual(self.graph.get_weight(4, 0), 2.5)
+        self.assertEqual(self.graph.get_weight(0, 4), 4)
+        self.assertTrue(self.graph.remove_edge(0, 4))
+        self.assertFalse(self.graph.remove_edge(0, 4))
+        self.assertFalse(self.graph.remove_edge(1, 5))
+        self.assertEqual([e.to for e in self.graph.edges_from(0)], [1])
+        self.assertEqual(list(self.graph.offsets), [0, 1, 3, 5, 6, 7])
+
+    def test_add_edge_rejects_weight_before_mutating(self):
+        for weight in ("x", 1 << 64):
+            with self.assertRaises((TypeError, OverflowError)):
+                self.graph.add_edge(0, 2, weight)
+            self.assertEqual(self.graph.edge_count, 7)
+            self.assertEqual(self.graph.offsets[-1], len(self.graph.targets))
+            self.assertEqual(len(self.graph.weights), len(self.graph.targets))
+            self.assertFalse(self.graph.is_adjacent(0, 2))
+        unweighted = csr.CSRGraph.from_edges(2, [(0, 1, None)])
+        with self.assertRaises(TypeError):
+            unweighted.add_edge(1, 0, "x")
+        self.assertIsNone(unweighted.weights)
+        self.assertEqual(unweighted.edge_count, 1)
+
+    def test_conversions(self):
+        list_graph = self.graph.to_list_graph()
+        matrix_graph = self.graph.to_matrix_graph()
+        self.assertIsInstance(list_graph, base.AdjacentListGraph)
+        self.assertIsInstance(matrix_graph, base.AdjacentMatrixGraph)
+        for other in (list_graph, matrix_graph):
+            back = csr.CSRGraph.from_graph(other)
+            self.assertEqual(list(back.offsets), list(self.graph.offsets))
+            self.assertEqual(list(back.targets), list(self.graph.targets))
+            self.assertEqual(list(back.weights), list(self.graph.weights))
+
+    def test_unweighted_to_matrix_graph(self):
+        graph = csr.CSRGraph.from_edges(3, [(0, 1, None), (1, 2, None)])
+        matrix_graph = graph.to_matrix_graph()
+        self.assertTrue(matrix_graph.is_adjacent(0, 1))
+        self.assertTrue(matrix_graph.is_adjacent(1, 2))
+        self.assertEqual(list(matrix_graph.neighbors(0)), [1])
+        self.assertEqual(
+            bfs.distances_from(matrix_graph, 0), bfs.distances_from(graph, 0)
+        )
+
+    def test_bfs(self):
+        list_graph = self.graph.to_list_graph()
+        self.assertEqual(
+            bfs.distances_from(list_graph, 0), bfs.distances_from(self.graph, 0)
+        )
+        self.assertEqual(bfs.shortest_path(self.graph, 2, 4), [2, 1, 4])
+        self.assertEqual(bfs.shortest_path(self.graph, 4, 0), [])
+
+    def test_sources_to(self):
+        self.assertEqual(self.graph.sources_to(4), [0, 1, 3])
+        self.assertEqual(self.graph.reverse().get_weight(4, 1), 3)
+        self.graph.add_edge(4, 1)
+        self.assertEqual(self.graph.sources_to(1), [0, 2, 4])
+        self.assertEqual(
+            list(self.graph.weighted_sources_to(4)),
+            [(from_, self.graph.get_weight(from_, 4)) for from_ in (0, 1, 3)],
+        )
+        self.assertEqual(self.graph.degree(4), 1)
+        self.assertEqual(
+            bfs.shortest_path(self.graph, 2, 4, bidirectional=True), [2, 1, 4]
+        )
+
+    def test_neighbors_are_views(self):
+        targets = self.graph.neighbors(1)
+        self.assertIsInstance(targets, memoryview)
+        self.graph.add_edge(1, 0, 5)
+        self.assertEqual(list(targets), [3, 4])
+        self.assertEqual(list(self.graph.neighbors(1)), [3, 4, 0])
+        pairs = self.graph.weighted_neighbors(1)
+        self.graph.remove_edge(1, 3)
+        self.assertEqual(list(pairs), [(3, 2), (4, 3), (0, 5)])
+        self.assertEqual(list(self.graph.weighted_neighbors(1)), [(4, 3), (0, 5)])
+        self.assertEqual(self.graph.edges_from(1)[1].weight, 5)
+
+    def test_uniform_weight(self):
+        self.assertEqual(self.graph.uniform_weight(), (False, None))
+        uniform = csr.CSRGraph.from_edges(3, [(0, 1, 2), (1, 2, 2)])
+        self.assertEqual(uniform.uniform_weight(), (True, 2))
+        uniform.add_edge(2, 0, 3)
+        self.assertEqual(uniform.uniform_weight(), (False, None))
+        uniform.remove_edge(2, 0)
+        self.assertEqual(uniform.uniform_weight(), (True, 2))
+        unweighted = csr.CSRGraph.from_edges(2, [(0, 1, None)])
+        self.assertEqual(unweighted.uniform_weight(), (True, None))
+
+    def test_neighbors(self):
+        self.assertEqual(list(self.graph.neighbors(1)), [3, 4])
+        self.assertEqual(list(self.graph.weighted_neighbors(1)), [(3, 2), (4, 3)])
+        unweighted = csr.CSRGraph.from_edges(2, [(0, 1, None)])
+        self.assertEqual(list(unweighted.weighted_neighbors(0)), [(1, None)])
@@ -0,0 +1,74 @@
+import unittest
+
+from src.graph import base, csr, dijkstra
+
+
+class TestDijkstra(unittest.TestCase):
+    def prepare_graph(self, graph):
+        """
+        0 --5--> 1 --1--> 3
+        |        ^        ^
+        1        1        7
+        v        |        |
+        2 --1--> 4 ---/   5 (unreachable)
+        """
+        graph.add_edge(0, 1, 5)
+        graph.add_edge(0, 2, 1)
+        graph.add_edge(2, 4, 1)
+        graph.add_edge(4, 1, 1)
+        graph.add_edge(4, 3, 7)
+        graph.add_edge(1, 3, 1)
+        return graph
+
+    def setUp(self):
+        list_graph = self.prepare_graph(
+            base.AdjacentListGraph([base.Vertex() for _ in range(6)])
+        )
+        matrix_graph = self.prepare_graph(base.AdjacentMatrixGraph(6))
+        self.graphs = (list_graph, matrix_graph, csr.CSRGraph.from_graph(list_graph))
+
+    def test_dijkstra(self):
+        for graph in self.graphs:
+            distances, predecessors = dijkstra.dijkstra(graph, 0)
+            self.assertEqual(distances, [0, 3, 1, 4, 2, None])
+            self.assertEqual(predecessors, [None, 4, 0, 1, 2, None])
+            self.assertEqual(dijkstra.path_to(predecessors, 0, 3), [0, 2, 4, 1, 3])
+            self.assertEqual(dijkstra.path_to(predecessors, 0, 5), [])
+            self.assertEqual(dijkstra.path_to(predecessors, 0, 0), [0])
+
+    def test_dijkstra_early_exit(self):
+        for graph in self.graphs:
+            distances, predecessors = dijkstra.dijkstra(graph, 0, to=4)
+            self.assertEqual(distances[4], 2)
+            self.assertIsNone(distances[3])
+            self.assertEqual(dijkstra.path_to(predecessors, 0, 4), [0, 2, 4])
+
+    def test_negative_weight(self):
+        graph = base.AdjacentMatrixGraph(2)
+        graph.add_edge(0, 1, -1)
+        with self.assertRaises(ValueError):
+            dijkstra.dijkstra(graph, 0)
+
+    def test_zero_one_bfs(self):
+        graph = base.AdjacentListGraph([base.Vertex() for _ in range(5)])
+        edges = [(0, 1, 1), (1, 2, 1), (0, 3, 0), (3, 2, 1), (2, 4, 0)]
+        for from_, to, weight in edges:
+            graph.add_edge(from_, to, weight)
+        self.assertTrue(dijkstra.is_zero_one(graph))
+        expected = dijkstra.dijkstra(graph, 0)[0]
+        distances, predecessors = dijkstra.zero_one_bfs(graph, 0)
+        self.assertEqual(distances, expected)
+        self.assertEqual(distances, [0, 1, 1, 0, 1])
+        self.assertEqual(dijkstra.path_to(predecessors, 0, 4), [0, 3, 2, 4])
+        self.assertEqual(dijkstra.shortest_distances(graph, 0)[0], expected)
+
+    def test_zero_one_bfs_rejects_other_weights(self):
+        self.assertFalse(dijkstra.is_zero_one(self.graphs[0]))
+        with self.assertRaises(ValueError):
+            dijkstra.zero_one_bfs(self.graphs[0], 0)
+
+    def test_shortest_distances(self):
+        for graph in self.graphs:
+            self.assertEqual(
+                dijkstra.shortest_distances(graph, 0), dijkstra.dijkstra(graph, 0)
+            )
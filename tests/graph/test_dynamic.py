@@ -0,0 +1,68 @@
+import unittest
+from random import Random
+from unittest import mock
+
+from src.graph import base, dijkstra, dynamic
+
+
+class TestDynamicDistances(unittest.TestCase):
+    def setUp(self):
+        """
+        0 ---> 1
+        |   /  | ^
+        |  /   |  2
+        v v    v v
+        4 <---  3
+        """
+        self.graph = base.AdjacentListGraph([base.Vertex() for _ in range(5)])
+        edges = [(0, 1, 1), (0, 4, 4), (1, 3, 2), (1, 4, 3), (2, 1, 1), (2, 3, 1)]
+        for from_, to, weight in edges + [(3, 4, 1)]:
+            self.graph.add_edge(from_, to, weight)
+
+    def test_insert_and_remove(self):
+        tracker = dynamic.DynamicDistances(self.graph, 0)
+        self.assertEqual(tracker.distances, [0, 1, None, 3, 4])
+        self.graph.add_edge(0, 2, 1)
+        self.assertEqual(tracker.distances, [0, 1, 1, 2, 3])
+        self.assertEqual(tracker.path_to(4), [0, 2, 3, 4])
+        self.graph.remove_edge(0, 2)
+        self.assertEqual(tracker.distances, [0, 1, None, 3, 4])
+        self.graph.remove_edge(0, 1)
+        self.assertEqual(tracker.distances, [0, None, None, None, 4])
+        tracker.close()
+        self.graph.add_edge(0, 1, 1)
+        self.assertEqual(tracker.distances, [0, None, None, None, 4])
+
+    def test_remove_uses_own_reverse_adjacency(self):
+        tracker = dynamic.DynamicDistances(self.graph, 0)
+        self.graph.add_edge(2, 4, 2)
+        self.graph.add_edge(0, 2, 1)
+        with mock.patch.object(self.graph, "sources_to", side_effect=AssertionError):
+            self.graph.remove_edge(0, 1)
+        self.assertEqual(tracker.distances, dijkstra.dijkstra(self.graph, 0)[0])
+
+    def test_subscribe(self):
+        events = []
+        graph = base.AdjacentMatrixGraph(3)
+        graph.subscribe(lambda *event: events.append(event))
+        graph.add_edge(0, 1, 5)
+        graph.add_edge(0, 1, 6)
+        graph.remove_edge(0, 1)
+        self.assertEqual(events, [(True, 0, 1, 5), (False, 0, 1, None)])
+        self.assertEqual(graph.version, 2)
+
+    def test_random_updates(self):
+        random = Random(0)
+        n = 25
+        for graph in (
+            base.AdjacentListGraph([base.Vertex() for _ in range(n)], indexed=True),
+            base.AdjacentMatrixGraph(n),
+        ):
+            tracker = dynamic.DynamicDistances(graph, 0)
+            for _ in range(300):
+                from_, to = random.randrange(n), random.randrange(n)
+                if random.random() < 0.6:
+                    graph.add_edge(from_, to, random.randint(0, 5))
+                else:
+                    graph.remove_edge(from_, to)
+                self.assertEqual(tracker.distances, dijkstra.dijkstra(graph, 0)[0])
@@ -0,0 +1,115 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.graph import base, bfs, csr, loader
+
+
+class TestLoader(unittest.TestCase):
+    text = """# from to weight
+0 1 1
+0 4 4
+1 3 2
+1 4 3
+
+2 1 1
+2 3 1
+3 4 1
+0 1 9
+"""
+
+    def test_iter_edge_chunks(self):
+        chunks = list(loader.iter_edge_chunks(io.StringIO(self.text), chunk_size=3))
+        self.assertEqual([len(sources) for sources, _, _ in chunks], [3, 3, 2])
+        sources, targets, weights = chunks[0]
+        self.assertEqual(
+            (list(sources), list(targets), weights), ([0, 0, 1], [1, 4, 3], [1, 4, 2])
+        )
+
+    def test_iter_edge_chunks_mixed_weights(self):
+        lines = ["0 1", "1 2 2.5", "2 0"]
+        chunks = list(loader.iter_edge_chunks(lines))
+        self.assertEqual(chunks[0][2], [None, 2.5, None])
+        self.assertEqual(list(loader.iter_edge_chunks(["0 1", "1 2"]))[0][2], [])
+
+    def test_iter_edge_chunks_csv(self):
+        lines = ["from,to,weight", "0,1,5", "1,2,7"]
+        sources, targets, weights = next(loader.iter_edge_chunks(lines, delimiter=","))
+        self.assertEqual(
+            (list(sources), list(targets), weights), ([0, 1], [1, 2], [5, 7])
+        )
+        with self.assertRaises(ValueError):
+            list(loader.iter_edge_chunks(["0 1", "x y"]))
+
+    def test_iter_edge_chunks_header(self):
+        lines = ["# exported", "", "src,dst", "0,1"]
+        sources, targets, _ = next(loader.iter_edge_chunks(lines, delimiter=","))
+        self.assertEqual((list(sources), list(targets)), ([0], [1]))
+        for lines in (["1 x", "2 3"], ["0 1", "from to"]):
+            with self.assertRaisesRegex(ValueError, "malformed edge on line"):
+                list(loader.iter_edge_chunks(lines))
+        with self.assertRaisesRegex(ValueError, "malformed weight on line 3"):
+            list(loader.iter_edge_chunks(["0 1 1", "", "1 2 heavy"]))
+
+    def test_read_edge_list(self):
+        for kind, cls in [
+            ("csr", csr.CSRGraph),
+            ("list", base.AdjacentListGraph),
+            ("matrix", base.AdjacentMatrixGraph),
+        ]:
+            graph = loader.read_edge_list(
+                io.StringIO(self.text), kind=kind, chunk_size=2
+            )
+            self.assertIsInstance(graph, cls)
+            self.assertEqual(graph.size, 5)
+            self.assertEqual(graph.get_weight(0, 1), 1)
+            self.assertEqual(graph.sources_to(4), [0, 1, 3])
+            self.assertEqual(bfs.distances_from(graph, 2), [None, 1, 0, 1, 4])
+        graph = loader.read_edge_list(io.StringIO("0 1\n"), size=3)
+        self.assertEqual((graph.size, graph.weights), (3, None))
+        with self.assertRaises(ValueError):
+            loader.read_edge_list(io.StringIO(self.text), kind="dense")
+
+    def test_read_edge_list_unweighted_and_duplicates(self):
+        text = "0 1\n1 2\n0 1\n2 0\n1 2\n"
+        expected = [0, 0, 0]
+        for kind in ("csr", "list", "matrix"):
+            with self.subTest(kind=kind):
+                graph = loader.read_edge_list(io.StringIO(text), kind=kind)
+                self.assertEqual(bfs.distances_from(graph, 0), expected)
+                self.assertEqual(sorted(graph.neighbors(0)), [1])
+                self.assertEqual(graph.sources_to(0), [2])
+
+    def test_read_edge_list_checks_node_ids(self):
+        for text, size in [("0 5 1\n", 3), ("7 0\n", 3), ("0 -1\n", None)]:
+            with self.subTest(text=text, size=size):
+                with self.assertRaisesRegex(ValueError, "out of range"):
+                    loader.read_edge_list(io.StringIO(text), size=size)
+
+    def test_binary_round_trip(self):
+        graph = loader.read_edge_list(io.StringIO(self.text))
+        unweighted = csr.CSRGraph.from_edges(3, [(0, 1, None), (2, 0, None)])
+        with tempfile.TemporaryDirectory() as tmp:
+            for source in (graph, graph.to_list_graph(), unweighted):
+                path = os.path.join(tmp, "graph.csr")
+                with open(path, "wb") as f:
+                    loader.save_binary(source, f)
+                for use_mmap in (True, False):
+                    loaded = loader.load_binary(path, use_mmap=use_mmap)
+                    for from_ in range(source.size):
+                        self.assertEqual(
+                            list(source.weighted_neighbors(from_)),
+                            list(loaded.weighted_neighbors(from_)),
+                        )
+                    self.assertTrue(loaded.add_edge(1, 0, 5))
+                    self.assertEqual(loaded.get_weight(1, 0), 5)
+                    del loaded
+
+    def test_load_binary_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.csr")
+            with open(path, "wb") as f:
+                f.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                loader.load_binary(path)
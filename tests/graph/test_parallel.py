@@ -0,0 +1,59 @@
+import unittest
+from random import Random
+from unittest import mock
+
+from src.graph import base, bfs, csr, parallel
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        random = Random(0)
+        self.graph = base.AdjacentListGraph([base.Vertex() for _ in range(30)])
+        for _ in range(80):
+            from_, to = random.randrange(30), random.randrange(30)
+            self.graph.add_edge(from_, to, random.randint(1, 3))
+
+    def test_shared_csr_graph(self):
+        with parallel.SharedCSRGraph(self.graph) as shared:
+            attached = parallel.attach(shared.spec)
+            for from_ in range(self.graph.size):
+                self.assertEqual(
+                    bfs.distances_from(self.graph, from_),
+                    bfs.distances_from(attached, from_),
+                )
+            del attached
+            while parallel._worker_blocks:
+                parallel._worker_blocks.pop().close()
+
+    def test_distances_from_many(self):
+        sources = list(range(self.graph.size))
+        results = dict(
+            parallel.distances_from_many(self.graph, sources, workers=2, chunksize=4)
+        )
+        self.assertEqual(sorted(results), sources)
+        for source in sources:
+            self.assertEqual(results[source], bfs.distances_from(self.graph, source))
+
+    def test_distances_from_many_without_shared_memory(self):
+        with mock.patch.object(parallel, "shared_memory", None):
+            with self.assertRaises(RuntimeError):
+                parallel.SharedCSRGraph(self.graph)
+            results = dict(parallel.distances_from_many(self.graph, [0, 5], workers=2))
+        for source in (0, 5):
+            self.assertEqual(results[source], bfs.distances_from(self.graph, source))
+
+    def test_distances_from_many_unweighted_csr(self):
+        graph = csr.CSRGraph.from_edges(3, [(0, 1, None), (1, 2, None)])
+        results = dict(parallel.distances_from_many(graph, [0, 2], workers=1))
+        self.assertEqual(results, {0: [0, 0, 0], 2: [None, None, 0]})
+
+    def test_distances_from_many_without_edges(self):
+        graph = base.AdjacentListGraph([base.Vertex() for _ in range(3)])
+        with parallel.SharedCSRGraph(graph) as shared:
+            attached = parallel.attach(shared.spec)
+            self.assertEqual(attached.edge_count, 0)
+            self.assertEqual(list(attached.neighbors(2)), [])
+        results = dict(parallel.distances_from_many(graph, [0, 1, 2], workers=1))
+        self.assertEqual(
+            results, {0: [0, None, None], 1: [None, 0, None], 2: [None, None, 0]}
+        )
@@ -0,0 +1,35 @@
+import unittest
+from random import Random
+
+from src.graph import base, bfs, union_find
+
+
+class TestUnionFind(unittest.TestCase):
+    def test_union_and_find(self):
+        uf = union_find.UnionFind(6)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.add_edge(2, 3))
+        self.assertFalse(uf.union(1, 0))
+        self.assertEqual(2, uf.add_edges([(1, 2), (4, 5), (3, 0)]))
+        self.assertEqual(2, uf.count)
+        self.assertEqual(4, uf.component_size(3))
+        self.assertEqual(
+            [True, False, True], uf.connected_many([(0, 3), (0, 4), (5, 4)])
+        )
+        self.assertEqual([0, 0, 0, 0, 1, 1], uf.labels())
+
+    def test_component_labels(self):
+        random = Random(0)
+        graph = base.AdjacentListGraph([base.Vertex() for _ in range(40)])
+        for _ in range(30):
+            graph.add_edge(random.randrange(40), random.randrange(40), 1)
+        labels = union_find.component_labels(graph)
+        uf = union_find.UnionFind.from_graph(graph)
+        self.assertEqual(uf.count, len(set(labels)))
+        for from_ in range(graph.size):
+            for to in graph.neighbors(from_):
+                self.assertEqual(labels[from_], labels[to])
+            reached = bfs.distances_from(graph, from_)
+            for to, dist in enumerate(reached):
+                if dist is not None:
+                    self.assertTrue(uf.connected(from_, to))
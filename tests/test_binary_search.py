@@ -1,5 +1,8 @@
 import unittest
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src import binary_search
 
@@ -41,3 +44,152 @@ class TestBinarySearch(unittest.TestCase):
             ),
             0,
         )
+
+    def test_binary_search_calls_condition_once_per_step(self):
+        calls = []
+
+        def condition(n):
+            calls.append(n)
+            return n >= 700
+
+        self.assertEqual(binary_search.binary_search(condition, 0, 1024), 700)
+        self.assertLessEqual(len(calls), 2 + 10)
+
+    def test_binary_search_adjacent_bounds(self):
+        def condition(n):
+            return n >= 5
+
+        self.assertEqual(binary_search.binary_search(condition, 4, 5), 5)
+        self.assertEqual(binary_search.binary_search(condition, 5, 6), 5)
+        self.assertIsNone(binary_search.binary_search(condition, 3, 3))
+
+    def test_binary_search_memo(self):
+        calls = []
+
+        def condition(n):
+            calls.append(n)
+            return n >= 37
+
+        memo = {}
+        self.assertEqual(binary_search.binary_search(condition, 0, 100, memo), 37)
+        first = len(calls)
+        self.assertEqual(binary_search.binary_search(condition, 0, 100, memo), 37)
+        self.assertEqual(len(calls), first)
+        self.assertEqual(len(memo), first)
+
+    def test_gallop_search(self):
+        for solution in (0, 1, 2, 3, 100, 12345):
+            calls = []
+
+            def condition(n):
+                calls.append(n)
+                return n >= solution
+
+            with self.subTest(solution=solution):
+                self.assertEqual(binary_search.gallop_search(condition), solution)
+                self.assertLessEqual(len(calls), 2 * solution.bit_length() + 2)
+        self.assertEqual(binary_search.gallop_search(lambda n: n >= 15, 10), 15)
+        self.assertEqual(binary_search.gallop_search(lambda n: n >= 9, 0, 9), 9)
+        self.assertIsNone(binary_search.gallop_search(lambda n: n >= 50, 0, 40))
+        for solution in (5, 6, 40, 41):
+            calls = []
+
+            def condition(n):
+                calls.append(n)
+                return n >= solution
+
+            with self.subTest(solution=solution, limit=40):
+                expected = solution if solution <= 40 else None
+                actual = binary_search.gallop_search(condition, 0, 40)
+                self.assertEqual(actual, expected)
+                self.assertEqual(len(calls), len(set(calls)))
+                self.assertLessEqual(max(calls), 40)
+
+    def test_real_binary_search(self):
+        root = binary_search.real_binary_search(lambda x: x * x >= 2, 0, 2, 1e-12)
+        self.assertAlmostEqual(root, 2 ** 0.5, places=11)
+        self.assertGreaterEqual(root * root, 2)
+        self.assertEqual(binary_search.real_binary_search(lambda x: True, 1, 2), 1)
+        self.assertIsNone(binary_search.real_binary_search(lambda x: x > 5, 0, 2))
+
+    def test_kary_binary_search_matches_binary_search(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for solution in [0, 1, 2, 57, 99, 100, 150]:
+                with self.subTest(solution=solution):
+
+                    def condition(n):
+                        return n >= solution
+
+                    self.assertEqual(
+                        binary_search.kary_binary_search(
+                            condition, 0, 100, k=4, executor=executor
+                        ),
+                        binary_search.binary_search(condition, 0, 100),
+                    )
+        self.assertEqual(
+            binary_search.kary_binary_search(lambda n: n >= 3, 0, 10, k=2), 3
+        )
+        with self.assertRaises(ValueError):
+            binary_search.kary_binary_search(lambda n: True, 0, 10, k=1)
+
+    def test_kary_binary_search_rounds(self):
+        probes = []
+        lock = threading.Lock()
+
+        def condition(n):
+            with lock:
+                probes.append(n)
+            return n >= 4321
+
+        result = binary_search.kary_binary_search(condition, 0, 10000, k=10)
+        self.assertEqual(result, 4321)
+        # two bounds, then at most 9 probes in each of ceil(log10(10000)) rounds
+        self.assertLessEqual(len(probes), 2 + 9 * 4)
+
+    def test_kary_binary_search_cancels_pending_probes(self):
+        probes = []
+
+        def condition(n):
+            probes.append(n)
+            time.sleep(0.02)
+            return n >= 1
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(
+                binary_search.kary_binary_search(
+                    condition, 0, 8, k=8, executor=executor
+                ),
+                1,
+            )
+        self.assertLess(len(probes), 2 + 7)
+
+    def test_parallel_binary_search(self):
+        values = [random.randint(0, 5) for _ in range(200)]
+        queries = [random.randint(0, 600) for _ in range(50)] + [0, 10 ** 6]
+        state = {"total": 0}
+        advances = []
+
+        def reset():
+            state["total"] = values[0]
+
+        def advance(t):
+            advances.append(t)
+            state["total"] += values[t]
+
+        def reaches(query, t):
+            return state["total"] >= query
+
+        result = binary_search.parallel_binary_search(
+            queries, 0, len(values) - 1, reset, advance, reaches
+        )
+        for query, answer in zip(queries, result):
+            expected = binary_search.binary_search(
+                lambda t: sum(values[:t + 1]) >= query, 0, len(values) - 1
+            )
+            self.assertEqual(answer, expected)
+        rounds = (len(values) + 1).bit_length()
+        self.assertLessEqual(len(advances), rounds * len(values))
+        self.assertEqual(
+            binary_search.parallel_binary_search([], 0, 10, reset, advance, reaches),
+            [],
+        )
@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+from operator import itemgetter
+from random import Random
+
+from src import persistent_sorted_collection, sorted_collection
+
+
+class TestPersistentSortedCollection(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "index.scol")
+        self.key = itemgetter(2)
+        self.records = [
+            ("a", "foo", 30),
+            ("b", "bar", 28),
+            ("c", "baz", 22),
+            ("d", "hogehoge", 32),
+        ]
+        self.target = self.open()
+        for record in self.records:
+            self.target.insert(record)
+
+    def tearDown(self):
+        self.target.close()
+        self.tmp.cleanup()
+
+    def open(self, key=None, **kwargs):
+        return persistent_sorted_collection.PersistentSortedCollection(
+            self.path, key or self.key, "q", **kwargs
+        )
+
+    def reopen(self):
+        self.target.close()
+        self.target = self.open()
+
+    def test_buffered_and_stored_agree(self):
+        expected = sorted(self.records, key=self.key)
+        self.assertEqual(list(self.target), expected)
+        self.target.flush()
+        self.assertEqual(list(self.target), expected)
+        self.reopen()
+        self.assertEqual(list(self.target), expected)
+        self.assertEqual(len(self.target), 4)
+
+    def test_find(self):
+        self.reopen()
+        self.target.insert(("e", "fuga", 29))
+        test_cases = [
+            ("==", 28, ("b", "bar", 28)),
+            ("==", 29, ("e", "fuga", 29)),
+            (">", 28, ("e", "fuga", 29)),
+            (">=", 29, ("e", "fuga", 29)),
+            ("<", 30, ("e", "fuga", 29)),
+            ("<=", 28, ("b", "bar", 28)),
+        ]
+        for relation_op, k, expected in test_cases:
+            with self.subTest(relation_op=relation_op, k=k):
+                self.assertEqual(self.target.find(relation_op, k), expected)
+        for relation_op, k in [("==", 31), (">", 32), ("<", 22)]:
+            with self.assertRaises(ValueError):
+                self.target.find(relation_op, k)
+
+    def test_index_count_contains(self):
+        self.reopen()
+        self.target.insert(("e", "fuga", 28))
+        self.assertEqual(self.target.count(28), 2)
+        self.assertEqual(self.target.index(28), 1)
+        self.assertEqual(self.target.index(30), 3)
+        self.assertIn(("e", "fuga", 28), self.target)
+        self.assertIn(("b", "bar", 28), self.target)
+        self.assertNotIn(("x", "bar", 28), self.target)
+        with self.assertRaises(ValueError):
+            self.target.index(29)
+
+    def test_remove_leaves_tombstone_until_flush(self):
+        self.reopen()
+        self.target.insert(("e", "fuga", 28))
+        self.target.remove(28)
+        self.assertEqual(self.target.find("==", 28), ("e", "fuga", 28))
+        self.assertEqual(self.target.find("<", 28), ("c", "baz", 22))
+        self.target.remove(28)
+        self.target.remove(22)
+        with self.assertRaises(ValueError):
+            self.target.remove(28)
+        with self.assertRaises(ValueError):
+            self.target.find("<", 30)
+        self.reopen()
+        expected = [("a", "foo", 30), ("d", "hogehoge", 32)]
+        self.assertEqual(list(self.target), expected)
+
+    def test_buffer_size_triggers_merge(self):
+        self.target.close()
+        self.target = self.open(buffer_size=2)
+        self.target.insert(("e", "fuga", 1))
+        self.assertEqual(len(self.target._keys), 4)
+        self.target.insert(("f", "piyo", 2))
+        self.assertEqual(len(self.target._keys), 6)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_rejects_other_files(self):
+        self.target.close()
+        with self.assertRaises(ValueError):
+            persistent_sorted_collection.PersistentSortedCollection(
+                self.path, self.key, "d"
+            )
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            self.open()
+        os.remove(self.path)
+        self.target = self.open()
+
+    def test_default_typecode(self):
+        self.target.close()
+        self.target = persistent_sorted_collection.PersistentSortedCollection(
+            self.path, self.key
+        )
+        self.assertEqual(self.target.typecode, "q")
+        self.assertEqual(len(self.target), 4)
+        self.target.insert(("e", "fuga", 2**53 + 1))
+        self.assertEqual(self.target.count(2**53 + 1), 1)
+        other = persistent_sorted_collection.PersistentSortedCollection(
+            os.path.join(self.tmp.name, "floats.scol"), self.key
+        )
+        with other:
+            self.assertEqual(other.typecode, "d")
+            other.insert(("a", "foo", 0.5))
+            with self.assertRaises(OverflowError):
+                other.insert(("b", "bar", 2**53 + 1))
+            self.assertEqual(other.count(2**53 + 1), 0)
+
+    def test_random_operations(self):
+        random = Random(0)
+        self.target.close()
+        os.remove(self.path)
+        self.target = self.open(itemgetter(0), buffer_size=7)
+        expected = sorted_collection.SortedCollection([], itemgetter(0))
+        for step in range(400):
+            k = random.randrange(30)
+            if random.random() < 0.6:
+                expected.insert_right((k, step))
+                self.target.insert((k, step))
+            elif k in expected.keys:
+                expected.remove(k)
+                self.target.remove(k)
+            if step % 50 == 0:
+                self.target.close()
+                self.target = self.open(itemgetter(0), buffer_size=7)
+            self.assertEqual(expected.count(k), self.target.count(k))
+            for op in ("==", "<", "<=", ">", ">="):
+                try:
+                    result = expected.find(op, k)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        self.target.find(op, k)
+                else:
+                    self.assertEqual(result, self.target.find(op, k))
+        self.assertEqual(expected.items, list(self.target))
@@ -1,10 +1,16 @@
+import threading
 import unittest
+from random import Random
 from operator import itemgetter
+from unittest import mock
 
 from src import sorted_collection
 
 
 class TestSortedCollection(unittest.TestCase):
+    def make(self, items, key):
+        return sorted_collection.SortedCollection(items, key)
+
     def setUp(self):
         self.records = [
             ("a", "foo", 30),
@@ -13,7 +19,7 @@ class TestSortedCollection(unittest.TestCase):
             ("d", "hogehoge", 32),
         ]
         self.key = itemgetter(2)
-        self.target = sorted_collection.SortedCollection(self.records, self.key)
+        self.target = self.make(self.records, self.key)
 
     def test_constructor(self):
         sorted_records = [
@@ -88,7 +94,7 @@ class TestSortedCollection(unittest.TestCase):
             ("hogehoge", 3),
             ("hogehogehoge", 3),
         ]
-        s = sorted_collection.SortedCollection(records, itemgetter(1))
+        s = self.make(records, itemgetter(1))
         self.assertEqual(s.count(1), 2)
         self.assertEqual(s.count(2), 1)
         self.assertEqual(s.count(3), 3)
@@ -159,3 +165,291 @@ class TestSortedCollection(unittest.TestCase):
         for relation_op, key in invalid_cases:
             with self.assertRaises(ValueError):
                 self.target.find(relation_op, key)
+
+    def test_irange(self):
+        records = self.target.items
+        test_cases = [
+            ((28, 30), {}, records[1:3]),
+            ((28, 30), {"inclusive": (False, True)}, records[2:3]),
+            ((28, 30), {"inclusive": (True, False)}, records[1:2]),
+            ((None, 29), {}, records[:2]),
+            ((29, None), {}, records[2:]),
+            ((23, 27), {}, []),
+            ((30, 22), {}, []),
+            ((None, None), {"reverse": True}, records[::-1]),
+            ((22, 30), {"reverse": True}, records[2::-1]),
+        ]
+        for args, kwargs, expected in test_cases:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(list(self.target.irange(*args, **kwargs)), expected)
+
+    def test_rank_and_count_range(self):
+        self.assertEqual(self.target.rank(22), 0)
+        self.assertEqual(self.target.rank(29), 2)
+        self.assertEqual(self.target.rank(99), 4)
+        self.assertEqual(self.target.count_range(22, 30), 3)
+        self.assertEqual(self.target.count_range(22, 30, (False, False)), 1)
+        self.assertEqual(self.target.count_range(hi=28), 2)
+        self.assertEqual(self.target.count_range(31, 23), 0)
+
+    def test_update(self):
+        self.target.update([("e", "fuga", 28), ("f", "piyo", 10)])
+        self.assertEqual(list(self.target.keys), [10, 22, 28, 28, 30, 32])
+        self.assertEqual(self.target[2], ("b", "bar", 28))
+        self.assertEqual(self.target[3], ("e", "fuga", 28))
+        self.target.update([])
+        self.assertEqual(len(self.target), 6)
+
+    def test_remove_many(self):
+        self.target.remove_many([30, 22])
+        self.assertEqual(list(self.target.keys), [28, 32])
+        with self.assertRaises(ValueError):
+            self.target.remove_many([28, 28])
+        self.assertEqual(list(self.target.keys), [28, 32])
+        many = self.make([(str(i), "", i % 50) for i in range(200)], self.key)
+        many.remove_many([i % 50 for i in range(0, 200, 2)])
+        expected = [k for k in range(1, 50, 2) for _ in range(4)]
+        self.assertEqual(list(many.keys), expected)
+
+    def test_merge(self):
+        other = self.make([("e", "fuga", 30), ("f", "piyo", 40)], self.key)
+        merged = self.target.merge(other)
+        self.assertIsInstance(merged, type(self.target))
+        self.assertEqual(list(merged.keys), [22, 28, 30, 30, 32, 40])
+        self.assertEqual(merged[2], ("a", "foo", 30))
+        self.assertEqual(list(self.target.keys), [22, 28, 30, 32])
+        with self.assertRaises(ValueError):
+            self.target.merge(self.make([], itemgetter(0)))
+
+    def test_find_many(self):
+        queries = [32, 21, 29, 22, 40]
+        for relation_op in ("==", ">", ">=", "<", "<="):
+            expected = []
+            for k in queries:
+                try:
+                    expected.append(self.target.find(relation_op, k))
+                except ValueError:
+                    expected.append(None)
+            with self.subTest(relation_op=relation_op):
+                self.assertEqual(
+                    self.target.find_many(relation_op, queries, None), expected
+                )
+        with self.assertRaises(ValueError):
+            self.target.find_many("==", queries)
+
+
+class TestBucketedSortedCollection(TestSortedCollection):
+    def make(self, items, key):
+        return sorted_collection.BucketedSortedCollection(items, key, load=1)
+
+    def test_constructor(self):
+        self.assertEqual(self.target.keys, [22, 28, 30, 32])
+        self.assertEqual(len(self.target._key_buckets), 4)
+
+    def test_clear(self):
+        self.target.clear()
+        self.assertEqual(self.target.items, [])
+        self.assertEqual(len(self.target), 0)
+        self.target.insert(("e", "fuga", 31))
+        self.assertEqual(self.target.keys, [31])
+
+    def test_copy(self):
+        copy = self.target.copy()
+        self.assertEqual(self.target.items, copy.items)
+        self.assertEqual(copy._load_factor, 1)
+
+    def test_getitem_negative_and_slice(self):
+        self.assertEqual(self.target[-1], ("d", "hogehoge", 32))
+        self.assertEqual(self.target[1:3], self.target.items[1:3])
+        with self.assertRaises(IndexError):
+            self.target[4]
+
+    def test_random_operations(self):
+        random = Random(0)
+        for load in (1, 2, 5):
+            expected = sorted_collection.SortedCollection([], itemgetter(0))
+            target = sorted_collection.BucketedSortedCollection(
+                [], itemgetter(0), load=load
+            )
+            for step in range(500):
+                item = (random.randrange(40), step)
+                operation = random.random()
+                if operation < 0.35:
+                    expected.insert(item)
+                    target.insert(item)
+                elif operation < 0.7:
+                    expected.insert_right(item)
+                    target.insert_right(item)
+                elif item[0] in expected.keys:
+                    expected.remove(item[0])
+                    target.remove(item[0])
+                else:
+                    with self.assertRaises(ValueError):
+                        target.remove(item[0])
+                self.assertEqual(expected.items, target.items)
+                self.assertEqual(expected.items, list(target))
+                self.assertEqual(expected.items[::-1], list(reversed(target)))
+                k = random.randrange(42)
+                self.assertEqual(expected.count(k), target.count(k))
+                hi = k + random.randrange(10)
+                self.assertEqual(
+                    list(expected.irange(k, hi)), list(target.irange(k, hi))
+                )
+                self.assertEqual(
+                    list(expected.irange(k, hi, reverse=True)),
+                    list(target.irange(k, hi, reverse=True)),
+                )
+                for op in ("==", "<", "<=", ">", ">="):
+                    try:
+                        result = expected.find(op, k)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            target.find(op, k)
+                    else:
+                        self.assertEqual(result, target.find(op, k))
+            for i in range(len(expected)):
+                self.assertEqual(expected[i], target[i])
+            queries = [random.randrange(42) for _ in range(30)]
+            ops = ("==", "<", "<=", ">", ">=")
+            self.assertEqual(
+                [expected.find_many(op, queries, None) for op in ops],
+                [target.find_many(op, queries, None) for op in ops],
+            )
+
+    def test_find_many_does_not_copy_keys(self):
+        keys = mock.PropertyMock(side_effect=AssertionError("keys copied"))
+        with mock.patch.object(type(self.target), "keys", keys):
+            self.assertEqual(
+                self.target.find_many(">=", [29, 22, 40], None),
+                [("a", "foo", 30), ("c", "baz", 22), None],
+            )
+
+
+class TestNumericSortedCollection(TestSortedCollection):
+    def make(self, items, key):
+        return sorted_collection.NumericSortedCollection(items, key, "q")
+
+    def test_constructor(self):
+        self.assertEqual(self.target.typecode, "q")
+        self.assertEqual(self.target.keys.tolist(), [22, 28, 30, 32])
+        self.assertEqual(self.target.keys.itemsize, 8)
+        with self.assertRaises(ValueError):
+            sorted_collection.NumericSortedCollection([], self.key, "u")
+
+    def test_key_setter(self):
+        self.target.key = lambda record: -record[2]
+        self.assertEqual(self.target.keys.tolist(), [-32, -30, -28, -22])
+        self.assertEqual(self.target[0], ("d", "hogehoge", 32))
+
+    def test_copy(self):
+        copy = self.target.copy()
+        copy.insert(("e", "fuga", 1))
+        self.assertEqual(len(self.target), 4)
+        self.assertEqual(copy.keys.tolist(), [1, 22, 28, 30, 32])
+
+    def test_float_keys(self):
+        target = sorted_collection.NumericSortedCollection(
+            [0.5, -1.25, 3.0, 0.5], float
+        )
+        self.assertEqual(target.items, [-1.25, 0.5, 0.5, 3.0])
+        self.assertEqual(target.find("<", 0.5), -1.25)
+        self.assertEqual(
+            target.find_many(">", [0.5, -2, 3.0], None), [3.0, -1.25, None]
+        )
+        with self.assertRaises(TypeError):
+            self.make([("x", "", 1.5)], self.key)
+
+    def test_default_typecode(self):
+        target = sorted_collection.NumericSortedCollection([3, 2**53 + 1], abs)
+        self.assertEqual(target.typecode, "q")
+        self.assertEqual(target.count(2**53 + 1), 1)
+        self.assertEqual(target.count(2**53), 0)
+        empty = sorted_collection.NumericSortedCollection([], lambda x: x)
+        empty.insert(2)
+        self.assertEqual(empty.typecode, "q")
+        empty.insert(0.5)
+        self.assertEqual(empty.typecode, "d")
+        self.assertEqual(empty.keys.tolist(), [0.5, 2.0])
+        empty.update([1, 1.5])
+        self.assertEqual(empty.items, [0.5, 1, 1.5, 2])
+        with self.assertRaises(OverflowError):
+            target.insert(0.5)
+        with self.assertRaises(OverflowError):
+            empty.insert(2**53 + 1)
+        with self.assertRaises(OverflowError):
+            sorted_collection.NumericSortedCollection([0.5, 2**53 + 1], abs)
+        with self.assertRaises(OverflowError):
+            sorted_collection.NumericSortedCollection([2**53 + 1], int, "d")
+        self.assertEqual(target.items, [3, 2**53 + 1])
+        self.assertEqual(empty.items, [0.5, 1, 1.5, 2])
+
+
+class TestConcurrentSortedCollection(unittest.TestCase):
+    def setUp(self):
+        self.target = sorted_collection.ConcurrentSortedCollection(
+            range(20), lambda x: x // 2, load=2
+        )
+
+    def test_reads(self):
+        self.assertEqual(len(self.target), 20)
+        self.assertEqual(self.target.count(3), 2)
+        self.assertEqual(self.target.index(3), 6)
+        self.assertEqual(self.target.find(">", 3), 8)
+        self.assertEqual(list(self.target.irange(2, 3)), [4, 5, 6, 7])
+        self.assertIn(7, self.target)
+        self.assertEqual(self.target[-1], 19)
+
+    def test_snapshot_is_not_changed_by_writers(self):
+        before = self.target.snapshot()
+        self.target.insert(100)
+        self.target.remove(0)
+        self.target.insert_right(7)
+        self.assertEqual(before.items, list(range(20)))
+        self.assertEqual(self.target.items[:2], [1, 2])
+        self.assertEqual(self.target.items[-2:], [19, 100])
+        self.assertEqual(self.target.count(3), 3)
+
+    def test_failed_write_publishes_nothing(self):
+        before = self.target.snapshot()
+        with self.assertRaises(ValueError):
+            self.target.remove_many([1, 1, 1])
+        self.assertIs(self.target.snapshot(), before)
+
+    def test_bulk_writes(self):
+        self.target.update([3, 30])
+        self.target.remove_many([0, 9])
+        expected = sorted_collection.SortedCollection(range(20), lambda x: x // 2)
+        expected.update([3, 30])
+        expected.remove_many([0, 9])
+        self.assertEqual(self.target.items, expected.items)
+        self.target.clear()
+        self.assertEqual(len(self.target), 0)
+
+    def test_threads_see_consistent_snapshots(self):
+        errors = []
+        done = threading.Event()
+
+        def write(offset):
+            for i in range(300):
+                self.target.insert(offset + i)
+                if i % 3 == 0:
+                    self.target.remove((offset + i) // 2)
+
+        def read():
+            while not done.is_set():
+                snapshot = self.target.snapshot()
+                keys, items = snapshot.keys, snapshot.items
+                if keys != sorted(keys) or keys != [x // 2 for x in items]:
+                    errors.append((keys, items))
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        writers = [threading.Thread(target=write, args=(n,)) for n in (0, 1000)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.target), 20 + 600 - 200)
@@ -1,4 +1,7 @@
 import unittest
+from functools import reduce
+from operator import mul
+from random import Random
 
 from src import two_pointers
 
@@ -13,3 +16,58 @@ class TestTwoPointers(unittest.TestCase):
         ]
         for k, s, ans in test_cases:
             self.assertEqual(ans, two_pointers.solve_abc032_c(s, k))
+
+    def test_solve_abc032_c_matches_brute_force(self):
+        random = Random(0)
+        for _ in range(300):
+            s = [random.randint(0, 5) for _ in range(random.randint(1, 8))]
+            k = random.randint(-1, 30)
+            expected = max(
+                (j - i for i in range(len(s)) for j in range(i, len(s) + 1)
+                 if reduce(mul, s[i:j], 1) <= k),
+                default=0,
+            )
+            with self.subTest(s=s, k=k):
+                self.assertEqual(two_pointers.solve_abc032_c(s, k), expected)
+
+    def test_window_sums(self):
+        self.assertEqual(two_pointers.window_sums([1, 2, 3, 4], 2), [3, 5, 7])
+        self.assertEqual(two_pointers.window_sums([1, 2], 3), [])
+        with self.assertRaises(ValueError):
+            two_pointers.window_sums([1, 2], 0)
+
+    def test_longest_window_sum_at_most(self):
+        test_cases = [
+            ([1, 2, 3, 4, 5], 7, 3),
+            ([5, 1, 1, 1, 5], 3, 3),
+            ([4, 5], 3, 0),
+            ([], 3, 0),
+            ([0, 0, 9, 0], 0, 2),
+        ]
+        for array, limit, ans in test_cases:
+            with self.subTest(array=array, limit=limit):
+                self.assertEqual(
+                    two_pointers.longest_window_sum_at_most(array, limit), ans
+                )
+
+    def test_window_distinct(self):
+        array = [1, 2, 1, 3, 3, 3, 2]
+        self.assertEqual(
+            two_pointers.window_distinct_counts(array, 3), [2, 3, 2, 1, 2]
+        )
+        self.assertEqual(two_pointers.longest_window_distinct_at_most(array, 1), 3)
+        self.assertEqual(two_pointers.longest_window_distinct_at_most(array, 2), 4)
+        self.assertEqual(two_pointers.longest_window_distinct_at_most(array, 0), 0)
+
+    def test_window_extremes(self):
+        random = Random(1)
+        array = [random.randint(-50, 50) for _ in range(200)]
+        for width in (1, 2, 7, 200):
+            windows = [array[i:i + width] for i in range(len(array) - width + 1)]
+            with self.subTest(width=width):
+                self.assertEqual(
+                    two_pointers.window_minimums(array, width), list(map(min, windows))
+                )
+                self.assertEqual(
+                    two_pointers.window_maximums(array, width), list(map(max, windows))
+                )